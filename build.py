@@ -1,21 +1,42 @@
 """
 Build script to create standalone EXE using PyInstaller.
-Run: python build.py
+Run: python build.py [--onefile] [--upx] [--optimize {0,1,2}]
+
+The default is a one-folder build: the one-file bootloader unpacks the
+whole bundle to a temp directory on every launch, which makes cold
+start noticeably slower.  UPX is off by default for the same reason.
+Bundled bytecode is compiled at optimization level 2 (no asserts or
+docstrings), which shrinks the archive and the code objects loaded at
+start-up; the frozen interpreter runs with the same level.
 """
 
+import argparse
 import subprocess
 import sys
 import os
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Build VideoCodecConverter with PyInstaller.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--onedir", dest="onefile", action="store_false",
+                      help="build a folder with the EXE and its files (default, faster start-up)")
+    mode.add_argument("--onefile", dest="onefile", action="store_true",
+                      help="build a single self-extracting EXE")
+    parser.add_argument("--upx", action="store_true",
+                        help="compress binaries with UPX (slower start-up)")
+    parser.add_argument("--optimize", type=int, choices=(0, 1, 2), default=2,
+                        help="bytecode optimization level, as python -O/-OO (default: 2)")
+    parser.set_defaults(onefile=False)
+    opts = parser.parse_args()
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     run_py = os.path.join(script_dir, "run.py")
     icon_path = os.path.join(script_dir, "icon.ico")
 
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        "--onefile" if opts.onefile else "--onedir",
         "--windowed",
         "--name", "VideoCodecConverter",
         "--icon", icon_path,
@@ -23,8 +44,11 @@ def main():
         "--add-data", f"icon.ico;.",
         "--noconfirm",
         "--clean",
-        run_py,
+        "--optimize", str(opts.optimize),
     ]
+    if not opts.upx:
+        cmd.append("--noupx")
+    cmd.append(run_py)
 
     print("Building EXE with PyInstaller...")
     print(f"Command: {' '.join(cmd)}")
@@ -33,7 +57,10 @@ def main():
     result = subprocess.run(cmd, cwd=script_dir)
 
     if result.returncode == 0:
-        exe_path = os.path.join(script_dir, "dist", "VideoCodecConverter.exe")
+        if opts.onefile:
+            exe_path = os.path.join(script_dir, "dist", "VideoCodecConverter.exe")
+        else:
+            exe_path = os.path.join(script_dir, "dist", "VideoCodecConverter", "VideoCodecConverter.exe")
         print()
         print(f"Build successful!")
         print(f"EXE location: {exe_path}")
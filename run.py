@@ -5,10 +5,6 @@ Entry point for Video Codec Converter (VCC).
 import sys
 import os
 import traceback
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QIcon
-from vcc.ui.main_window import MainWindow
 
 
 def _global_exception_handler(exc_type, exc_value, exc_tb):
@@ -17,6 +13,7 @@ def _global_exception_handler(exc_type, exc_value, exc_tb):
     tb_text = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
     sys.stderr.write(tb_text)
     try:
+        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.critical(
             None,
             "Unexpected Error",
@@ -29,6 +26,13 @@ def _global_exception_handler(exc_type, exc_value, exc_tb):
 
 
 def main():
+    # Qt and the main window are imported here rather than at module level
+    # so the interpreter reaches main() without loading the GUI stack first.
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QFont, QIcon
+    from PyQt6.QtCore import Qt
+    from vcc.ui.main_window import MainWindow
+
     # Install global exception handler to prevent silent crashes
     sys.excepthook = _global_exception_handler
 
@@ -43,6 +47,10 @@ def main():
     except Exception:
         pass
 
+    # Lets the optional Qt WebEngine help view be imported lazily, after
+    # the application object already exists.
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     app.setApplicationName("Video Codec Converter")
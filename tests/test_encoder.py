@@ -0,0 +1,448 @@
+"""
+Tests for the non-GUI parts of EncoderWorker (no ffmpeg needed).
+"""
+
+import io
+import os
+import queue
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import PyQt6  # noqa: F401
+except ImportError:  # the worker is a QThread
+    PyQt6 = None
+
+if PyQt6 is not None:
+    from vcc.core.encoder import _PROGRESS_FIELD_RE, EncoderWorker
+    from vcc.core.job_state import IN_PROGRESS, JobStateDB
+
+
+@unittest.skipIf(PyQt6 is None, "PyQt6 is not installed")
+class EncoderTestCase(unittest.TestCase):
+    """Builds workers over empty input files in a temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = self._tmp.name
+        self.out_dir = os.path.join(self.tmp, "out")
+        os.makedirs(self.out_dir)
+
+    def make_inputs(self, *names: str) -> list[str]:
+        paths = []
+        for name in names:
+            path = os.path.join(self.tmp, name)
+            open(path, "wb").close()
+            paths.append(path)
+        return paths
+
+    def make_worker(self, files: list[str], **kwargs) -> EncoderWorker:
+        kwargs.setdefault("codec", "libx264")
+        worker = EncoderWorker(
+            files=files, output_dir=self.out_dir, width=1280, height=720,
+            codec_params={"crf": "23"}, pix_fmt="yuv420p", **kwargs,
+        )
+        self.logs: list[str] = []
+        self.finished: list[tuple[int, bool]] = []
+        self.commands: list[list[str]] = []
+        worker.log_output.connect(self.logs.append)
+        worker.file_finished.connect(
+            lambda idx, total, name, ok: self.finished.append((idx, ok))
+        )
+        worker._duration_futures = {src: None for src in files}
+        worker._duration_of = lambda src: 0.0
+        return worker
+
+    def fake_ffmpeg(self, worker: EncoderWorker, fail_when=lambda args: False):
+        """Replace the ffmpeg launch: record argv and create the outputs."""
+        outputs = {worker.make_output_name(src) for src in worker.files}
+
+        def run(key, args, cpus, total_duration, prefix):
+            self.commands.append(list(args))
+            if fail_when(args):
+                return 1
+            for arg in args:
+                if arg in outputs:
+                    open(arg, "wb").close()
+            return 0
+
+        worker._run_ffmpeg = run
+
+    def start_run(self, worker: EncoderWorker) -> None:
+        """Take the start-of-run snapshot that run() would take."""
+        self.job_state = JobStateDB(os.path.join(self.tmp, "state.db"))
+        self.addCleanup(self.job_state.close)
+        worker._job_state = self.job_state
+        with os.scandir(self.out_dir) as it:
+            worker._existing_outputs = {os.path.normcase(e.name) for e in it}
+
+
+class ResumeTests(EncoderTestCase):
+    def _leave_partial(self, worker, src):
+        dst = worker.make_output_name(src)
+        open(dst, "wb").close()
+        return dst
+
+    def test_keep_existing_deletes_incomplete_output(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a])
+        partial = self._leave_partial(worker, a)
+        self.start_run(worker)
+        self.job_state.mark(partial, IN_PROGRESS)
+
+        self.assertFalse(worker._keep_existing(partial))
+        self.assertFalse(os.path.exists(partial))
+        self.assertFalse(worker._output_exists(partial))
+        self.assertIn(f"Redoing incomplete output: {os.path.basename(partial)}\n", self.logs)
+
+    def test_keep_existing_keeps_finished_output(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a])
+        done = self._leave_partial(worker, a)
+        self.start_run(worker)
+
+        self.assertTrue(worker._keep_existing(done))
+        self.assertTrue(os.path.exists(done))
+
+    def test_group_falls_back_to_single_file_for_incomplete_output(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], files_per_process=2)
+        self.fake_ffmpeg(worker)
+        self._leave_partial(worker, a)             # finished earlier
+        partial = self._leave_partial(worker, b)   # interrupted earlier
+        self.start_run(worker)
+        self.job_state.mark(partial, IN_PROGRESS)
+
+        worker._encode_group([(1, a), (2, b)], 2)
+
+        self.assertTrue(os.path.exists(partial))
+        self.assertEqual(len(self.commands), 1)
+        self.assertIn(b, self.commands[0])
+        self.assertFalse(any("SKIP (exists): b.mp4" in line for line in self.logs))
+        self.assertEqual(sorted(self.finished), [(1, True), (2, True)])
+        self.assertFalse(self.job_state.is_incomplete(partial))
+
+    def test_group_redoes_incomplete_copy_compliant_output(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], files_per_process=2)
+        worker._copy_video.add(b)
+        self.fake_ffmpeg(worker)
+        partial = self._leave_partial(worker, b)
+        self.start_run(worker)
+        self.job_state.mark(partial, IN_PROGRESS)
+
+        worker._encode_group([(1, a), (2, b)], 2)
+
+        self.assertTrue(os.path.exists(partial))
+        # b is stream-copied on its own, then a runs by itself
+        self.assertEqual(len(self.commands), 2)
+        self.assertIn("copy", self.commands[0])
+        self.assertEqual(sorted(self.finished), [(1, True), (2, True)])
+
+    def test_only_files_to_encode_are_probed(self):
+        a, b, c, d = self.make_inputs("a.mp4", "b.mp4", "c.mp4", "d.mp4")
+        worker = self.make_worker([a, b, c, d])
+        worker._copy_video.add(c)
+        self._leave_partial(worker, a)             # finished earlier
+        partial = self._leave_partial(worker, b)   # interrupted earlier
+        self.start_run(worker)
+        self.job_state.mark(partial, IN_PROGRESS)
+
+        self.assertEqual(worker._files_to_probe(), [b, d])
+
+    def test_finished_output_is_still_skipped(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a], files_per_process=1)
+        self.fake_ffmpeg(worker)
+        self._leave_partial(worker, a)
+        self.start_run(worker)
+
+        worker._encode_one(1, 1, a)
+
+        self.assertEqual(self.commands, [])
+        self.assertEqual(self.finished, [(1, True)])
+
+
+class JobPoolTests(EncoderTestCase):
+    def test_auto_uses_half_the_cores_capped_by_file_count(self):
+        files = self.make_inputs(*(f"{i}.mp4" for i in range(6)))
+        with mock.patch("os.cpu_count", return_value=8):
+            self.assertEqual(self.make_worker(files).parallel_jobs, 4)
+            self.assertEqual(self.make_worker(files[:3]).parallel_jobs, 3)
+            self.assertEqual(self.make_worker(files[:1]).parallel_jobs, 1)
+
+    def test_auto_runs_two_gpu_encodes(self):
+        files = self.make_inputs(*(f"{i}.mp4" for i in range(6)))
+        with mock.patch("os.cpu_count", return_value=8):
+            worker = self.make_worker(files, codec="h264_nvenc")
+        self.assertEqual(worker.parallel_jobs, 2)
+
+    @unittest.skipUnless(hasattr(os, "sched_getaffinity"), "Linux only")
+    def test_cpu_slots_are_disjoint_blocks(self):
+        files = self.make_inputs("a.mp4", "b.mp4")
+        with mock.patch("os.sched_getaffinity", return_value={0, 1, 2, 3, 4}):
+            worker = self.make_worker(files, parallel_jobs=2)
+
+        slots = [worker._cpu_slots.get(), worker._cpu_slots.get()]
+        self.assertEqual(slots, [[0, 1], [2, 3]])
+
+
+class CompliantInputTests(EncoderTestCase):
+    STREAMS = {
+        "match.mp4": {"codec_name": "h264", "width": 1280, "height": 720, "pix_fmt": "yuv420p"},
+        "codec.mp4": {"codec_name": "hevc", "width": 1280, "height": 720, "pix_fmt": "yuv420p"},
+        "size.mp4": {"codec_name": "h264", "width": 1920, "height": 1080, "pix_fmt": "yuv420p"},
+        "pixfmt.mp4": {"codec_name": "h264", "width": 1280, "height": 720, "pix_fmt": "yuv444p"},
+    }
+
+    def find(self, worker):
+        probed = []
+
+        def probe(ffmpeg_path, src):
+            probed.append(os.path.basename(src))
+            return self.STREAMS.get(os.path.basename(src))
+
+        with mock.patch("vcc.core.encoder.probe_video_stream", probe):
+            worker._find_compliant_inputs()
+        return probed
+
+    def test_only_matching_video_is_remuxed(self):
+        files = self.make_inputs(*self.STREAMS, "unreadable.mp4")
+        worker = self.make_worker(files, copy_compliant=True)
+
+        self.find(worker)
+
+        self.assertEqual(worker._copy_video, {files[0]})
+
+    def test_trimmed_and_cropped_inputs_are_not_probed(self):
+        match, trimmed, cropped = self.make_inputs("match.mp4", "t.mp4", "c.mp4")
+        worker = self.make_worker(
+            [match, trimmed, cropped], copy_compliant=True,
+            file_trims={trimmed: ("00:00:01", "")}, file_crops={cropped: "640:360:0:0"},
+        )
+
+        self.assertEqual(self.find(worker), ["match.mp4"])
+
+    def test_video_changing_settings_disable_remux(self):
+        (match,) = self.make_inputs("match.mp4")
+        worker = self.make_worker([match], copy_compliant=True, fps="30")
+
+        self.assertEqual(self.find(worker), [])
+        self.assertEqual(worker._copy_video, set())
+
+
+class HwScaleTests(EncoderTestCase):
+    def enable_hw_scale(self, worker):
+        """Give *worker* the templates a VAAPI-capable ffmpeg would yield."""
+        worker._hw_scale_vf = "scale_vaapi=w=1280:h=720:format=nv12"
+        worker._hw_input_args = [
+            "-hwaccel", "vaapi", "-hwaccel_output_format", "vaapi",
+        ]
+        worker._hw_tail_args = list(worker._tail_args)
+
+    def test_software_worker_has_empty_hw_templates(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a])
+
+        self.assertFalse(worker._can_hw_scale(a))
+        self.assertEqual(worker._hw_input_args, [])
+        self.assertEqual(worker._hw_tail_args, [])
+
+    def test_scaler_check_runs_on_the_worker_thread(self):
+        (a,) = self.make_inputs("a.mp4")
+        with mock.patch("vcc.core.encoder._ffmpeg_filters",
+                        return_value=frozenset({"scale_cuda"})) as filters:
+            worker = self.make_worker([a])
+            filters.assert_not_called()
+            worker._gpu_enc = mock.Mock(hwaccel_flag="cuda")
+            worker._ffmpeg_path = "ffmpeg"
+            worker._init_hw_scale()
+
+        self.assertTrue(worker._can_hw_scale(a))
+        self.assertEqual(worker._hw_scale_vf, "scale_cuda=w=1280:h=720:format=nv12")
+        self.assertNotIn("-pix_fmt", worker._hw_tail_args)
+
+    def test_hw_scale_failure_retries_with_cpu_scaling(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a], files_per_process=1)
+        self.enable_hw_scale(worker)
+        self.fake_ffmpeg(worker, fail_when=lambda args: "-hwaccel_output_format" in args)
+        self.start_run(worker)
+
+        worker._encode_one(1, 1, a)
+
+        self.assertEqual(len(self.commands), 2)
+        self.assertIn("scale_vaapi=w=1280:h=720:format=nv12", self.commands[0])
+        self.assertNotIn("-hwaccel_output_format", self.commands[1])
+        self.assertIn("scale=1280:720", self.commands[1])
+        self.assertTrue(any("retrying with CPU scaling" in line for line in self.logs))
+        self.assertEqual(self.finished, [(1, True)])
+
+
+class ThreadCapTests(EncoderTestCase):
+    def pin(self, worker, cpus):
+        worker._cpu_slots = queue.SimpleQueue()
+        worker._cpu_slots.put(cpus)
+
+    def test_single_file_threads_match_cpu_block(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a], files_per_process=1)
+        self.fake_ffmpeg(worker)
+        self.start_run(worker)
+        self.pin(worker, [0, 1, 2, 3])
+
+        worker._encode_one(1, 1, a)
+
+        args = self.commands[0]
+        self.assertEqual(args[args.index("-threads") + 1], "4")
+
+    def test_group_outputs_split_cpu_block(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], files_per_process=2)
+        self.fake_ffmpeg(worker)
+        self.start_run(worker)
+        self.pin(worker, [0, 1, 2, 3])
+
+        worker._encode_group([(1, a), (2, b)], 2)
+
+        args = self.commands[0]
+        caps = [args[i + 1] for i, arg in enumerate(args) if arg == "-threads"]
+        self.assertEqual(caps, ["2", "2"])
+        # Each cap precedes its own output
+        self.assertEqual(args.index("-threads") + 2, args.index(worker.make_output_name(a)))
+
+
+    def test_unpinned_group_shares_the_job_threads(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], files_per_process=2)
+        self.fake_ffmpeg(worker)
+        self.start_run(worker)
+        worker._cpu_slots = None
+
+        with mock.patch("os.cpu_count", return_value=16):
+            worker.parallel_jobs = 2
+            worker._encode_group([(1, a), (2, b)], 2)
+
+        args = self.commands[0]
+        caps = [args[i + 1] for i, arg in enumerate(args) if arg == "-threads"]
+        self.assertEqual(caps, ["4", "4"])
+
+    def test_grouping_is_opt_in(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        items = [(1, a), (2, b)]
+
+        self.assertEqual(self.make_worker([a, b])._plan_jobs(items), [[(1, a)], [(2, b)]])
+        self.assertEqual(
+            self.make_worker([a, b], files_per_process=0)._plan_jobs(items), [items]
+        )
+
+    def test_group_progress_uses_longest_output(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], files_per_process=2)
+        worker._duration_of = {a: 30.0, b: 10.0}.get
+        durations = []
+
+        def run(key, args, cpus, total_duration, prefix):
+            durations.append(total_duration)
+            return 0
+
+        worker._run_ffmpeg = run
+        self.start_run(worker)
+        worker._encode_group([(1, a), (2, b)], 2)
+
+        self.assertEqual(durations, [30.0])
+
+
+class _ChunkedStream:
+    """Pipe stand-in whose reads return at most *chunk* bytes."""
+
+    def __init__(self, data: bytes, chunk: int):
+        self._data = io.BytesIO(data)
+        self._chunk = chunk
+
+    def read1(self, size: int) -> bytes:
+        return self._data.read(min(size, self._chunk))
+
+
+class _FakeProcess:
+    def __init__(self, output: bytes, chunk: int = 1 << 16):
+        self.stdout = _ChunkedStream(output, chunk)
+
+    def terminate(self):
+        pass
+
+
+# One -progress block as ffmpeg writes it, padding included
+_PADDED_BLOCK = (
+    "frame=120\n"
+    "fps=24.00\n"
+    "stream_0_0_q=28.0\n"
+    "bitrate= 512.3kbits/s\n"
+    "total_size=320000\n"
+    "out_time_us=5000000\n"
+    "out_time_ms=5000000\n"
+    "out_time=00:00:05.000000\n"
+    "dup_frames=0\n"
+    "drop_frames=0\n"
+    "speed= 0.5x\n"
+    "progress=continue\n"
+)
+
+
+class ProgressTests(EncoderTestCase):
+    def test_regex_reads_padded_values(self):
+        fields = dict(_PROGRESS_FIELD_RE.findall(_PADDED_BLOCK))
+        self.assertEqual(fields["bitrate"], "512.3kbits/s")
+        self.assertEqual(fields["speed"], "0.5x")
+        self.assertEqual(_PROGRESS_FIELD_RE.sub("", _PADDED_BLOCK), "")
+
+    def test_padded_block_updates_progress(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a], parallel_jobs=1)
+        progress = []
+        worker.file_progress.connect(lambda *args: progress.append(args))
+        output = ("Input #0, mov,mp4 from 'a.mp4':\n" + _PADDED_BLOCK).encode()
+
+        worker._read_output_with_progress(_FakeProcess(output), 10.0)
+
+        self.assertEqual(progress, [(0, 50, "0.5x", "00:00:10")])
+        log = "".join(self.logs)
+        self.assertIn("Input #0", log)
+        self.assertIn("bitrate=512.3kbits/s speed=0.5x", log)
+        self.assertNotIn("bitrate= ", log)
+        self.assertNotIn("total_size", log)
+
+    def test_lowest_active_job_reports_progress(self):
+        a, b = self.make_inputs("a.mp4", "b.mp4")
+        worker = self.make_worker([a, b], parallel_jobs=2)
+        progress = []
+        worker.file_progress.connect(lambda *args: progress.append(args))
+        worker._processes = {1: None, 2: None}
+        stats = {"out_time_us": "5000000", "speed": "1x"}
+
+        worker._report_progress(stats, 10.0, 2)
+        self.assertEqual(progress, [])
+        worker._report_progress(stats, 10.0, 1)
+        self.assertEqual(progress, [(1, 50, "1x", "00:00:05")])
+
+        del worker._processes[1]                   # file 1 finished
+        worker._report_progress(stats, 10.0, 2)
+        self.assertEqual(progress[-1][0], 2)
+
+    def test_block_split_across_reads(self):
+        (a,) = self.make_inputs("a.mp4")
+        worker = self.make_worker([a], parallel_jobs=1)
+        progress = []
+        worker.file_progress.connect(lambda *args: progress.append(args))
+
+        # 7-byte reads cut lines and padded values in the middle
+        worker._read_output_with_progress(_FakeProcess(_PADDED_BLOCK.encode(), 7), 10.0)
+
+        self.assertEqual(progress, [(0, 50, "0.5x", "00:00:10")])
+        self.assertNotIn("speed= ", "".join(self.logs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for JobStateDB, the store of outputs left unfinished by a batch.
+"""
+
+import os
+import tempfile
+import unittest
+
+from vcc.core.job_state import FAILED, IN_PROGRESS, JobStateDB
+
+
+class JobStateDBTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "cache", "jobs.db")
+        self.output = os.path.join(self._tmp.name, "out", "a.mkv")
+
+    def open_db(self) -> JobStateDB:
+        db = JobStateDB(self.path)
+        self.addCleanup(db.close)
+        return db
+
+    def test_mark_and_mark_done(self):
+        db = self.open_db()
+        self.assertFalse(db.is_incomplete(self.output))
+
+        db.mark(self.output, IN_PROGRESS)
+        self.assertTrue(db.is_incomplete(self.output))
+        db.mark(self.output, FAILED)
+        self.assertTrue(db.is_incomplete(self.output))
+
+        db.mark_done(self.output)
+        self.assertFalse(db.is_incomplete(self.output))
+
+    def test_state_survives_reopening(self):
+        db = self.open_db()
+        db.mark(self.output, IN_PROGRESS)
+        db.close()
+
+        self.assertTrue(self.open_db().is_incomplete(self.output))
+
+    def test_paths_are_normalised(self):
+        db = self.open_db()
+        db.mark(self.output, IN_PROGRESS)
+
+        relative = os.path.relpath(self.output)
+        self.assertTrue(db.is_incomplete(relative))
+
+    def test_unopenable_database_is_a_no_op(self):
+        # The cache "directory" is a regular file, so makedirs fails
+        blocker = os.path.join(self._tmp.name, "blocker")
+        open(blocker, "wb").close()
+        db = JobStateDB(os.path.join(blocker, "jobs.db"))
+
+        db.mark(self.output, IN_PROGRESS)
+        self.assertFalse(db.is_incomplete(self.output))
+        db.mark_done(self.output)
+        db.close()
+
+    def test_sqlite_errors_are_swallowed(self):
+        db = self.open_db()
+        db.mark(self.output, IN_PROGRESS)
+        db._conn.execute("DROP TABLE jobs")
+
+        self.assertFalse(db.is_incomplete(self.output))
+        db.mark(self.output, FAILED)
+        db.mark_done(self.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,84 +4,390 @@ FFmpeg encoder worker - runs encoding in a background thread, emitting signals f
 
 import os
 import re
-import glob
-import shutil
+import codecs
+import functools
+import json
+import queue
 import subprocess
+import threading
 import time
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from PyQt6.QtCore import QThread, pyqtSignal
-from vcc.core.gpu_detect import get_gpu_encoder, is_gpu_encoder
+from vcc.core.gpu_detect import CREATE_NO_WINDOW, get_gpu_encoder, is_gpu_encoder
+from vcc.core.job_state import FAILED, IN_PROGRESS, JobStateDB
+
+# FFmpeg output is read in raw chunks of this size.  Regular lines are
+# batched until 16 KiB or ~33 ms have accumulated; the one-line progress
+# summary is forwarded at most once per interval, keeping only the latest.
+_READ_CHUNK = 64 * 1024
+
+# Concurrent encodes when a GPU encoder is used and parallel_jobs is auto
+_GPU_PARALLEL_JOBS = 2
+
+# files_per_process auto mode: consecutive untrimmed inputs smaller than
+# this share one ffmpeg process (start-up dominates short clips)
+_AUTO_GROUP_BYTES = 32 * 1024 * 1024
+_AUTO_GROUP_MAX = 8
+
+# Capacity requested for ffmpeg's output pipe on Linux (the default is
+# 64 KiB), so a burst of output never blocks ffmpeg while we are busy
+_PIPE_SIZE = 1 << 20
+_LOG_BATCH_SIZE = 16 * 1024
+_LOG_BATCH_INTERVAL = 0.033  # seconds
+_LOG_FLUSH_INTERVAL = 0.05   # seconds, for progress lines
+# ffmpeg runs with "-progress pipe:1 -nostats": instead of the rewritten
+# "frame=... time=..." stats line it writes key=value blocks, each ended
+# by "progress=continue" (or "progress=end").  Some values are padded,
+# e.g. "bitrate= 512.3kbits/s" or "speed=   2x".
+_PROGRESS_ARGS = ("-nostats", "-progress", "pipe:1")
+_PROGRESS_FIELD_RE = re.compile(r"^([a-z][a-z0-9_]*)=[ \t]*(\S*)[ \t]*\n", re.M)
+# The fields _summarize_progress reads; the rest of each block is dropped
+_PROGRESS_KEYS = frozenset((
+    "frame", "fps", "bitrate", "out_time", "out_time_us", "out_time_ms", "speed", "progress",
+))
+
+# ffmpeg install locations checked by find_ffmpeg, expanded once at import
+_FFMPEG_EXE = "ffmpeg.exe" if os.name == "nt" else "ffmpeg"
+_WINGET_LINKS = os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\WinGet\Links\ffmpeg.exe")
+_WINGET_PKGS = os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\WinGet\Packages")
+_MANUAL_CANDIDATES = (
+    r"C:\ffmpeg\bin\ffmpeg.exe",
+    r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
+    r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
+)
+
+# Per-user cache directory (probe results, discovered ffmpeg location)
+_CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "vcc",
+)
+_FFMPEG_PATH_CACHE = os.path.join(_CACHE_DIR, "ffmpeg_path.txt")
+# Outputs left unfinished by a cancelled or crashed run (see job_state)
+_JOB_STATE_PATH = os.path.join(_CACHE_DIR, "job_state.db")
+
+# Escape for a single-quoted path in a concat demuxer list: ' -> '\''
+_CONCAT_QUOTE_ESCAPE = str.maketrans({"'": "'\\''"})
+
+# Fatal error reported through encoding_terminated
+_FFMPEG_NOT_FOUND = (
+    "ffmpeg not found! Please install FFmpeg and ensure ffmpeg.exe is in your system PATH."
+)
+
+
+def _scan_winget_packages(winget_pkgs: str) -> str | None:
+    """Find ffmpeg.exe inside a ``Gyan.FFmpeg*`` WinGet package directory.
+
+    Uses ``os.scandir`` so each directory is listed once and entry types
+    come straight from the directory listing instead of fnmatch + stat.
+    """
+    try:
+        with os.scandir(winget_pkgs) as it:
+            pkg_dirs = [
+                entry.path for entry in it
+                if entry.name.startswith("Gyan.FFmpeg")
+                and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return None
 
+    # Versioned layout: Gyan.FFmpeg*/ffmpeg-*/bin/ffmpeg.exe
+    for pkg in pkg_dirs:
+        try:
+            with os.scandir(pkg) as it:
+                for entry in it:
+                    if entry.name.startswith("ffmpeg-") and entry.is_dir():
+                        candidate = os.path.join(entry.path, "bin", "ffmpeg.exe")
+                        if os.path.isfile(candidate):
+                            return candidate
+        except OSError:
+            continue
+
+    # Flat layout: Gyan.FFmpeg*/ffmpeg.exe
+    for pkg in pkg_dirs:
+        candidate = os.path.join(pkg, "ffmpeg.exe")
+        if os.path.isfile(candidate):
+            return candidate
 
+    return None
+
+
+@functools.cache
 def find_ffmpeg() -> str:
     """
     Locate ffmpeg executable. Checks:
-    1. System PATH (shutil.which)
-    2. Winget install locations
-    3. Common manual install folders
+    1. System PATH
+    2. The location found by a previous run (ffmpeg_path.txt)
+    3. Winget install locations
+    4. Common manual install folders
     Returns the full path to ffmpeg.exe, or 'ffmpeg' as fallback.
+    The probe runs once per process; restart VCC to pick up a new install.
     """
-    # 1. Check PATH
-    path = shutil.which("ffmpeg")
-    if path:
-        return path
-
-    # 2. Winget shim directory
-    winget_links = os.path.expandvars(
-        r"%LOCALAPPDATA%\Microsoft\WinGet\Links\ffmpeg.exe"
-    )
-    if os.path.isfile(winget_links):
-        return winget_links
-
-    # 3. Winget package directories (version-agnostic glob)
-    winget_pkgs = os.path.expandvars(
-        r"%LOCALAPPDATA%\Microsoft\WinGet\Packages"
-    )
-    for pattern in [
-        os.path.join(winget_pkgs, "Gyan.FFmpeg*", "ffmpeg-*", "bin", "ffmpeg.exe"),
-        os.path.join(winget_pkgs, "Gyan.FFmpeg*", "ffmpeg.exe"),
-    ]:
-        matches = glob.glob(pattern)
-        if matches:
-            return matches[0]
-
-    # 4. Common manual install locations
-    for candidate in [
-        r"C:\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
-    ]:
+    # 1. Check PATH.  Only ffmpeg(.exe) is wanted, so unlike shutil.which
+    # this skips trying every PATHEXT suffix in every directory.
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if directory:
+            candidate = os.path.join(directory, _FFMPEG_EXE)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+
+    # 2. Location remembered from an earlier scan (one stat on a hit)
+    try:
+        with open(_FFMPEG_PATH_CACHE, encoding="utf-8") as f:
+            cached = f.read().strip()
+        if cached and os.path.isfile(cached):
+            return cached
+    except OSError:
+        pass
+
+    found = _scan_ffmpeg_locations()
+    if found is None:
+        return "ffmpeg"  # fallback — let subprocess raise FileNotFoundError
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_FFMPEG_PATH_CACHE, "w", encoding="utf-8") as f:
+            f.write(found)
+    except OSError:
+        pass
+    return found
+
+
+def _scan_ffmpeg_locations() -> str | None:
+    """Search the WinGet and manual install locations for ffmpeg.exe."""
+    # Winget shim directory
+    if os.path.isfile(_WINGET_LINKS):
+        return _WINGET_LINKS
+
+    # Winget package directories (version-agnostic scan)
+    found = _scan_winget_packages(_WINGET_PKGS)
+    if found:
+        return found
+
+    # Common manual install locations
+    for candidate in _MANUAL_CANDIDATES:
         if os.path.isfile(candidate):
             return candidate
 
-    return "ffmpeg"  # fallback — let subprocess raise FileNotFoundError
+    return None
+
+
+# ── Probe cache ───────────────────────────────────────────────────────
+# Durations from ffprobe, keyed by path + size + mtime so an edited file is
+# probed again.  Persisted as JSON so re-encoding a library skips ffprobe.
+
+_PROBE_CACHE_PATH = os.path.join(_CACHE_DIR, "probe_cache.json")
+_PROBE_CACHE_MAX = 4096  # entries kept on disk (most recent)
+_probe_cache: dict[str, float] | None = None  # loaded on first use
+_probe_cache_dirty = False
+_probe_cache_lock = threading.Lock()
+
+
+def _probe_cache_key(filepath: str) -> str | None:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return f"{os.path.abspath(filepath)}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def _load_probe_cache() -> dict[str, float]:
+    """Return the in-memory probe cache, reading it from disk once."""
+    global _probe_cache
+    if _probe_cache is None:
+        try:
+            with open(_PROBE_CACHE_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+            _probe_cache = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _probe_cache = {}
+    return _probe_cache
+
+
+def save_probe_cache() -> None:
+    """Write new probe results to disk.  Called once at the end of a run."""
+    global _probe_cache_dirty
+    with _probe_cache_lock:
+        if not _probe_cache_dirty or _probe_cache is None:
+            return
+        items = list(_probe_cache.items())[-_PROBE_CACHE_MAX:]
+        _probe_cache_dirty = False
+    try:
+        os.makedirs(os.path.dirname(_PROBE_CACHE_PATH), exist_ok=True)
+        tmp_path = _PROBE_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(items), f)
+        os.replace(tmp_path, _PROBE_CACHE_PATH)
+    except OSError:
+        pass
+
+
+@functools.cache
+def _ffprobe_for(ffmpeg_path: str) -> str:
+    """Return the ffprobe executable that sits next to *ffmpeg_path*.
+
+    Only the file name is rewritten, so a directory such as C:\\ffmpeg\\bin
+    is left intact.
+    """
+    directory, name = os.path.split(ffmpeg_path)
+    if not directory or "ffmpeg" not in name:
+        return "ffprobe"
+    return os.path.join(directory, name.replace("ffmpeg", "ffprobe", 1))
 
 
 def probe_duration(ffmpeg_path: str, filepath: str) -> float | None:
-    """Use ffprobe (same dir as ffmpeg) to get video duration in seconds."""
-    ffprobe = ffmpeg_path.replace("ffmpeg", "ffprobe") if "ffmpeg" in ffmpeg_path else "ffprobe"
+    """Use ffprobe (same dir as ffmpeg) to get video duration in seconds.
+
+    Results are cached per file (see ``save_probe_cache``).
+    """
+    global _probe_cache_dirty
+    key = _probe_cache_key(filepath)
+    if key is not None:
+        with _probe_cache_lock:
+            cached = _load_probe_cache().get(key)
+        if cached is not None:
+            return cached
+
+    duration = _run_ffprobe_duration(ffmpeg_path, filepath)
+    if duration is not None and key is not None:
+        with _probe_cache_lock:
+            _probe_cache[key] = duration
+            _probe_cache_dirty = True
+    return duration
+
+
+def _remember_duration(filepath: str, duration: float) -> None:
+    """Cache a duration that another ffprobe call already returned."""
+    global _probe_cache_dirty
+    key = _probe_cache_key(filepath)
+    if key is not None:
+        with _probe_cache_lock:
+            _load_probe_cache()[key] = duration
+            _probe_cache_dirty = True
+
+
+def _run_ffprobe_duration(ffmpeg_path: str, filepath: str) -> float | None:
+    """Run ffprobe on *filepath* and return its duration in seconds."""
+    ffprobe = _ffprobe_for(ffmpeg_path)
     try:
         r = subprocess.run(
-            [ffprobe, "-v", "error", "-show_entries", "format=duration",
+            [ffprobe, "-v", "error",
+             # The duration comes from the container header; don't let
+             # ffprobe analyse or read far into large / remote files
+             "-probesize", "5000000", "-analyzeduration", "5000000",
+             "-read_intervals", "%+#1",
+             "-show_entries", "format=duration",
              "-of", "default=noprint_wrappers=1:nokey=1", filepath],
             capture_output=True, text=True, timeout=10,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            creationflags=CREATE_NO_WINDOW,
         )
         return float(r.stdout.strip())
     except Exception:
         return None
 
 
+# ffprobe codec_name produced by each CPU encoder; GPU encoders are named
+# <codec>_<api> (hevc_nvenc, av1_qsv, ...)
+_ENCODER_CODEC_NAMES = {
+    "libsvtav1": "av1", "libaom-av1": "av1", "librav1e": "av1",
+    "libx264": "h264", "libx265": "hevc", "libvpx-vp9": "vp9",
+    "mpeg4": "mpeg4", "libvvenc": "vvc",
+}
+
+
+def probe_video_stream(ffmpeg_path: str, filepath: str) -> dict | None:
+    """Return codec_name, width, height and pix_fmt of the first video stream.
+
+    The container duration is read by the same call and added to the
+    probe cache, so a file that is then remuxed needs no second ffprobe.
+    """
+    ffprobe = _ffprobe_for(ffmpeg_path)
+    try:
+        r = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "stream=codec_name,width,height,pix_fmt:format=duration",
+             "-of", "json", filepath],
+            capture_output=True, text=True, timeout=10,
+            creationflags=CREATE_NO_WINDOW,
+        )
+        data = json.loads(r.stdout)
+    except Exception:
+        return None
+    try:
+        _remember_duration(filepath, float(data["format"]["duration"]))
+    except (KeyError, TypeError, ValueError):
+        pass
+    streams = data.get("streams") or []
+    return streams[0] if streams else None
+
+
+# GPU scaler per hwaccel.  With -hwaccel_output_format the decoded frames
+# stay in GPU memory, so decode, scale and encode never touch system RAM.
+_HW_SCALE_FILTERS = {"cuda": "scale_cuda", "qsv": "scale_qsv"}
+# Requested -pix_fmt -> surface format the GPU scaler outputs instead
+_HW_SURFACE_FORMATS = {
+    "": "", "nv12": "nv12", "yuv420p": "nv12",
+    "p010le": "p010le", "yuv420p10le": "p010le",
+}
+
+
+@functools.cache
+def _ffmpeg_filters(ffmpeg_path: str) -> frozenset[str]:
+    """Return the names of the filters *ffmpeg_path* was built with."""
+    try:
+        r = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-filters"],
+            capture_output=True, text=True, timeout=10,
+            creationflags=CREATE_NO_WINDOW,
+        )
+    except Exception:
+        return frozenset()
+    # Lines look like " ... scale_cuda        V->V       GPU accelerated ..."
+    return frozenset(
+        parts[1] for parts in map(str.split, r.stdout.splitlines()) if len(parts) > 2
+    )
+
+
+def _summarize_progress(stats: dict[str, str],
+                        total_duration: float) -> tuple[int, str, str, str]:
+    """Turn one ``-progress`` block into (percent, speed, eta, summary line).
+
+    *percent* and *eta* are 0 / "" when *total_duration* is unknown.
+    """
+    speed = stats.get("speed", "").strip()
+    try:
+        done_sec = int(stats.get("out_time_us") or stats.get("out_time_ms") or 0) / 1e6
+    except ValueError:
+        done_sec = 0.0
+
+    percent, eta = 0, ""
+    if total_duration > 0:
+        percent = max(0, min(100, int(done_sec / total_duration * 100)))
+        try:
+            rate = float(speed.rstrip("x"))
+        except ValueError:
+            rate = 0.0
+        if rate > 0:
+            remaining = int(max(0.0, total_duration - done_sec) / rate)
+            eta = f"{remaining // 3600:02d}:{remaining % 3600 // 60:02d}:{remaining % 60:02d}"
+
+    out_time = stats.get("out_time", "").partition(".")[0]
+    line = (
+        f"frame={stats.get('frame', '')} fps={stats.get('fps', '')} "
+        f"time={out_time} bitrate={stats.get('bitrate', '')} speed={speed}\n"
+    )
+    return percent, speed, eta, line
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_time_to_seconds(time_str: str) -> float:
     """Parse HH:MM:SS.xx or seconds string to float seconds."""
-    time_str = time_str.strip()
-    if ":" in time_str:
-        parts = time_str.split(":")
-        if len(parts) == 3:
-            return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-        elif len(parts) == 2:
-            return float(parts[0]) * 60 + float(parts[1])
-    return float(time_str)
+    head, sep, rest = time_str.strip().partition(":")
+    if not sep:
+        return float(head)
+    mid, sep, tail = rest.partition(":")
+    if not sep:
+        return float(head) * 60 + float(mid)
+    return float(head) * 3600 + float(mid) * 60 + float(tail)
 
 
 def detect_crop(ffmpeg_path: str, filepath: str, skip_seconds: int = 60,
@@ -105,7 +411,7 @@ def detect_crop(ffmpeg_path: str, filepath: str, skip_seconds: int = 60,
         r = subprocess.run(
             args,
             capture_output=True, text=True, timeout=30,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            creationflags=CREATE_NO_WINDOW,
         )
         # Parse the last cropdetect line
         crop_val = None
@@ -127,10 +433,11 @@ class EncoderWorker(QThread):
     log_output = pyqtSignal(str)        # raw line from ffmpeg
     file_started = pyqtSignal(int, int, str)  # index, total, filename
     file_finished = pyqtSignal(int, int, str, bool)  # index, total, filename, success
-    encoding_done = pyqtSignal()        # all files done
-    encoding_error = pyqtSignal(str)    # fatal error message
-    # Per-file progress: percent (0-100), speed_str, eta_str
-    file_progress = pyqtSignal(int, str, str)
+    # Emitted once when the run ends: "" when done (or cancelled),
+    # otherwise the fatal error message
+    encoding_terminated = pyqtSignal(str)
+    # Per-file progress: index, percent (0-100), speed_str, eta_str
+    file_progress = pyqtSignal(int, int, str, str)
 
     def __init__(
         self,
@@ -152,6 +459,9 @@ class EncoderWorker(QThread):
         concatenate: bool = False,
         film_grain: int = 0,
         sharpness: int = 0,
+        parallel_jobs: int = 0,
+        files_per_process: int = 1,
+        copy_compliant: bool = False,
         parent=None,
     ):
         super().__init__(parent)
@@ -173,63 +483,262 @@ class EncoderWorker(QThread):
         self.concatenate = concatenate
         self.film_grain = film_grain     # 0 = off, 1-50 for SVT-AV1
         self.sharpness = sharpness       # 0 = off, 0-7 for SVT-AV1 / libvpx-vp9
+        # Number of files encoded concurrently (0 = auto).  Auto is half the
+        # CPU cores for CPU codecs; GPU encoders leave the CPU mostly idle,
+        # but the hardware has few encode sessions, so two at a time.
+        if parallel_jobs <= 0:
+            if is_gpu_encoder(codec):
+                parallel_jobs = _GPU_PARALLEL_JOBS
+            else:
+                parallel_jobs = max(1, (os.cpu_count() or 2) // 2)
+        self.parallel_jobs = max(1, min(parallel_jobs, len(files) or 1))
+        # Files encoded by one ffmpeg process (1 = one process per file,
+        # 0 = auto: group small untrimmed clips, see _plan_jobs).  Every
+        # file in a batch shares the same pipeline, so a group only needs
+        # one ffmpeg start-up.  Grouping is opt-in: one bad input fails
+        # its whole group, which is then retried file by file.
+        self.files_per_process = max(0, files_per_process)
+        # Stream-copy the video of inputs that already match the requested
+        # codec, size and pixel format instead of re-encoding them
+        self.copy_compliant = copy_compliant
+        self._copy_video: set[str] = set()  # filled in by run
         self._cancelled = False
+        # Live ffmpeg children keyed by file index, so cancel() can stop them all
+        self._processes: dict[int, subprocess.Popen] = {}
+        self._proc_lock = threading.Lock()
+        # Names in output_dir at the start of the run (see run)
+        self._existing_outputs: set[str] | None = None
+        # Unfinished outputs of earlier runs, opened by run
+        self._job_state: JobStateDB | None = None
+        # Expected duration per file, probed ahead of the encodes (see run)
+        self._duration_futures: dict[str, Future] = {}
+        # Linux: each concurrent ffmpeg borrows a disjoint block of CPUs so
+        # parallel encodes do not contend for the same cores / L3 slice
+        self._cpu_slots: queue.SimpleQueue | None = None
+        if self.parallel_jobs > 1 and hasattr(os, "sched_getaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+            per_job = len(cpus) // self.parallel_jobs
+            if per_job >= 1:
+                self._cpu_slots = queue.SimpleQueue()
+                for i in range(self.parallel_jobs):
+                    self._cpu_slots.put(cpus[i * per_job:(i + 1) * per_job])
         self._ffmpeg_path = find_ffmpeg()
         self._gpu_enc = get_gpu_encoder(self.codec) if is_gpu_encoder(self.codec) else None
+        # Everything after the source basename is identical for the whole batch
+        self._name_tail = self._build_name_tail()
+        # Per-file argv templates (see build_ffmpeg_args)
+        # Trims pre-stripped once; files without any trim are left out
+        self._trims: dict[str, tuple[str, str]] = {}
+        for path, (start, end) in self.file_trims.items():
+            start, end = (start or "").strip(), (end or "").strip()
+            if start or end:
+                self._trims[path] = (start, end)
+        self._ow_flag = "-y" if self.overwrite else "-n"
+        self._scale_filter = f"scale={self.width}:{self.height}"
+        gpu = self._gpu_enc
+        self._hwaccel_args = ["-hwaccel", gpu.hwaccel_flag] if gpu and gpu.hwaccel_flag else []
+        self._encode_args = self._build_encode_args()
+        # GPU scaling templates, filled in by _init_hw_scale on the worker thread
+        self._hw_scale_vf = ""
+        self._hw_input_args: list[str] = []
+        self._hw_tail_args: list[str] = []
+        # Every output shares the batch extension, hence the subtitle codec
+        self._sub_codec = self._subtitle_codec_for(self._name_tail)
+        # Fixed argv fragments around the per-file parts
+        self._head_args = [self._ffmpeg_path, "-hide_banner", *_PROGRESS_ARGS, self._ow_flag]
+        self._tail_args = [*self._encode_args, "-c:s", self._sub_codec]
+        self._copy_tail_args = [
+            "-c:v", "copy", "-c:a", self.audio_codec, "-c:s", self._sub_codec,
+        ]
+
+        # Platform spawn options, built once.  Windows: hide the console
+        # window via STARTUPINFO too.  close_fds stays at its default: the
+        # duration prefetch spawns ffprobe while ffmpeg runs, and with
+        # close_fds=False ffmpeg could inherit ffprobe's pipe handles.
+        # Elsewhere: enlarge the output pipe (used on Linux).
+        self._popen_extra: dict = {}
+        if os.name == "nt":
+            si = subprocess.STARTUPINFO()
+            si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            si.wShowWindow = 0  # SW_HIDE
+            self._popen_extra["startupinfo"] = si
+        else:
+            self._popen_extra["pipesize"] = _PIPE_SIZE
 
     def cancel(self):
         self._cancelled = True
-        if hasattr(self, "_process") and self._process and self._process.poll() is None:
-            self._process.terminate()
-
-    def build_ffmpeg_args(self, src: str, dst: str) -> list[str]:
-        """Build the ffmpeg argument list for a single file."""
-        ow_flag = "-y" if self.overwrite else "-n"
-        has_bitrate = bool(self.bitrate and self.bitrate.strip())
-        gpu = self._gpu_enc
+        with self._proc_lock:
+            processes = list(self._processes.values())
+        for proc in processes:
+            if proc.poll() is None:
+                proc.terminate()
+
+    def _spawn(self, key: int, args: list[str],
+               cpus: list[int] | None = None) -> subprocess.Popen:
+        """Start an ffmpeg child and register it under *key* for cancellation.
+
+        *cpus* pins the child to those CPUs (Linux only).  It is applied
+        right after the spawn rather than via preexec_fn, which is unsafe
+        with the pool threads; ffmpeg's worker threads inherit the mask.
+        ffmpeg sizes its thread pools before the mask is set, so callers
+        pass a matching ``-threads`` in *args* (see _threads_for).
+        """
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=_READ_CHUNK,
+            creationflags=CREATE_NO_WINDOW,
+            **self._popen_extra,
+        )
+        if cpus:
+            try:
+                os.sched_setaffinity(proc.pid, cpus)
+            except OSError:
+                pass
+        with self._proc_lock:
+            self._processes[key] = proc
+        if self._cancelled:
+            proc.terminate()
+        return proc
+
+    def _release(self, key: int) -> None:
+        with self._proc_lock:
+            self._processes.pop(key, None)
+
+    # Stream mapping shared by every per-file command
+    _MAP_ARGS = (
+        "-map_metadata", "0",
+        "-map_chapters", "0",
+        "-map", "0:v:0",
+        "-map", "0:a?",
+        "-map", "0:s?",
+    )
 
-        # Build the -vf filter chain: crop (if set) then scale
-        vf_parts = []
-        crop_val = self.file_crops.get(src, "")
-        if crop_val:
-            vf_parts.append(crop_val)  # e.g. "crop=1920:800:0:140"
-        vf_parts.append(f"scale={self.width}:{self.height}")
-        vf_chain = ",".join(vf_parts)
+    def build_ffmpeg_args(self, src: str, dst: str, hw_scale: bool = False,
+                          threads: int = 0) -> list[str]:
+        """Build the ffmpeg argument list for a single file.
 
+        Only the crop filter, trim times, input and output vary per file;
+        everything else comes from the templates built in ``__init__``.
+        *hw_scale* scales on the GPU (see ``_can_hw_scale``); *threads*
+        caps the encoder threads (0 = ffmpeg's default).
+        """
         # Per-file trim times
-        trim_start, trim_end = self.file_trims.get(src, ("", ""))
+        trim_start, trim_end = self._trims.get(src, ("", ""))
 
-        args = [
-            self._ffmpeg_path,
-            "-hide_banner",
-            ow_flag,
-        ]
+        args = self._head_args.copy()
 
         # Trim: start time (before -i for fast seek)
-        if trim_start and trim_start.strip():
-            args.extend(["-ss", trim_start.strip()])
+        if trim_start:
+            args += ("-ss", trim_start)
 
         # GPU hardware-accelerated decoding (optional, speeds up decode)
-        if gpu and gpu.hwaccel_flag:
-            args.extend(["-hwaccel", gpu.hwaccel_flag])
-
-        args.extend([
-            "-i", src,
-        ])
+        args += self._hw_input_args if hw_scale else self._hwaccel_args
+        args += ("-i", src)
 
         # Trim: end time (after -i)
-        if trim_end and trim_end.strip():
-            args.extend(["-to", trim_end.strip()])
-
-        args.extend([
-            "-map_metadata", "0",
-            "-map_chapters", "0",
-            "-map", "0:v:0",
-            "-map", "0:a?",
-            "-map", "0:s?",
-            "-vf", vf_chain,
-            "-c:v", self.codec,
-        ])
+        if trim_end:
+            args += ("-to", trim_end)
+
+        args += self._MAP_ARGS
+        if src in self._copy_video:
+            args += self._copy_tail_args
+        elif hw_scale:
+            args += ("-vf", self._hw_scale_vf)
+            args += self._hw_tail_args
+        else:
+            args += ("-vf", self._vf_chain(src))
+            args += self._tail_args
+        if threads:
+            args += ("-threads", str(threads))
+        args.append(dst)
+
+        return args
+
+    def build_group_ffmpeg_args(self, jobs: list[tuple[str, str]],
+                                threads: int = 0) -> list[str]:
+        """Build one ffmpeg argument list that encodes several files.
+
+        Each ``(src, dst)`` pair becomes its own input and its own output
+        carrying the same options build_ffmpeg_args would give it.
+        *threads* is the encoder thread cap of each output.
+        """
+        args = self._head_args.copy()
+
+        # Inputs: per-file fast seek and hwaccel must precede each -i
+        for src, _dst in jobs:
+            trim_start, _trim_end = self._trims.get(src, ("", ""))
+            if trim_start:
+                args.extend(["-ss", trim_start])
+            args.extend(self._hwaccel_args)
+            args.extend(["-i", src])
+
+        # Outputs: options apply to the output file that follows them
+        for n, (src, dst) in enumerate(jobs):
+            _trim_start, trim_end = self._trims.get(src, ("", ""))
+            if trim_end:
+                args.extend(["-to", trim_end])
+            args.extend([
+                "-map_metadata", str(n), "-map_chapters", str(n),
+                "-map", f"{n}:v:0", "-map", f"{n}:a?", "-map", f"{n}:s?",
+            ])
+            args.extend(["-vf", self._vf_chain(src)])
+            args.extend(self._tail_args)
+            if threads:
+                args.extend(["-threads", str(threads)])
+            args.append(dst)
+
+        return args
+
+    def _init_hw_scale(self) -> None:
+        """Build the GPU scaling templates (see _HW_SCALE_FILTERS).
+
+        Checking for the scaler runs ``ffmpeg -filters``, so this is called
+        from run() rather than __init__, which runs on the GUI thread.  The
+        scaler converts to the surface format itself, so -pix_fmt is dropped
+        from those commands.
+        """
+        gpu = self._gpu_enc
+        pix_fmt = (self.pix_fmt or "").strip()
+        if not (gpu and gpu.hwaccel_flag in _HW_SCALE_FILTERS
+                and pix_fmt in _HW_SURFACE_FORMATS):
+            return
+        scaler = _HW_SCALE_FILTERS[gpu.hwaccel_flag]
+        if not self._ffmpeg_path or scaler not in _ffmpeg_filters(self._ffmpeg_path):
+            return
+        surface = _HW_SURFACE_FORMATS[pix_fmt]
+        self._hw_scale_vf = f"{scaler}=w={self.width}:h={self.height}"
+        if surface:
+            self._hw_scale_vf += f":format={surface}"
+        self._hw_input_args = [
+            "-hwaccel", gpu.hwaccel_flag, "-hwaccel_output_format", gpu.hwaccel_flag,
+        ]
+        hw_encode_args = list(self._encode_args)
+        if "-pix_fmt" in hw_encode_args:
+            i = hw_encode_args.index("-pix_fmt")
+            del hw_encode_args[i:i + 2]
+        self._hw_tail_args = [*hw_encode_args, "-c:s", self._sub_codec]
+
+    def _can_hw_scale(self, src: str) -> bool:
+        """Return True if *src* can be scaled on the GPU.
+
+        Crop is a CPU filter, so cropped files keep the software chain.
+        """
+        return bool(self._hw_scale_vf) and src not in self._copy_video \
+            and not self.file_crops.get(src)
+
+    def _vf_chain(self, src: str) -> str:
+        """Return the -vf filter chain for *src*: crop (if set) then scale."""
+        crop_val = self.file_crops.get(src, "")
+        return f"{crop_val},{self._scale_filter}" if crop_val else self._scale_filter
+
+    def _build_encode_args(self) -> list[str]:
+        """Build the batch-constant arguments from ``-c:v`` through ``-c:a``."""
+        has_bitrate = bool(self.bitrate and self.bitrate.strip())
+        gpu = self._gpu_enc
+
+        args = ["-c:v", self.codec]
 
         # Frame rate
         if self.fps and self.fps.strip():
@@ -281,20 +790,20 @@ class EncoderWorker(QThread):
             args.extend(["-pix_fmt", self.pix_fmt])
 
         args.extend(["-c:a", self.audio_codec])
+        return args
+
+    def _subtitle_codec_for(self, dst: str) -> str:
+        """Subtitle codec — MP4/M4V/MOV/3GP only support mov_text.
 
-        # Subtitle codec — MP4/M4V/MOV/3GP only support mov_text.
-        # If the user chose "copy" or an incompatible codec, auto-switch
-        # to mov_text for those containers so FFmpeg doesn't fail.
+        If the user chose "copy" or an incompatible codec, auto-switch
+        to mov_text for those containers so FFmpeg doesn't fail.
+        """
         dst_ext = os.path.splitext(dst)[1].lower()
         sub_codec = self.subtitle_codec
         if dst_ext in (".mp4", ".m4v", ".mov", ".3gp"):
             if sub_codec in ("copy", "ass", "srt", "subrip"):
                 sub_codec = "mov_text"
-        args.extend(["-c:s", sub_codec])
-
-        args.append(dst)
-
-        return args
+        return sub_codec
 
     def _apply_gpu_params(
         self, args: list[str], gpu, has_bitrate: bool
@@ -339,9 +848,8 @@ class EncoderWorker(QThread):
             return "webm"
         return "mkv"
 
-    def make_output_name(self, src_path: str) -> str:
-        """Generate output filename like: basename.WxH.codec.paramN.mkv"""
-        base = os.path.splitext(os.path.basename(src_path))[0]
+    def _build_name_tail(self) -> str:
+        """Build the batch-constant part of the output name: .WxH.codec.paramN.ext"""
         label = f"{self.width}x{self.height}"
 
         # Build param suffix
@@ -355,32 +863,35 @@ class EncoderWorker(QThread):
         if self.bitrate and self.bitrate.strip():
             param_parts.append(f"br{self.bitrate.strip()}")
 
-        param_str = ".".join(param_parts) if param_parts else ""
+        param_str = ".".join(param_parts)
         ext = self._get_output_extension()
 
         if param_str:
-            name = f"{base}.{label}.{self.codec}.{param_str}.{ext}"
-        else:
-            name = f"{base}.{label}.{self.codec}.{ext}"
+            return f".{label}.{self.codec}.{param_str}.{ext}"
+        return f".{label}.{self.codec}.{ext}"
 
-        return os.path.join(self.output_dir, name)
+    def make_output_name(self, src_path: str) -> str:
+        """Generate output filename like: basename.WxH.codec.paramN.mkv"""
+        base = os.path.splitext(os.path.basename(src_path))[0]
+        return os.path.join(self.output_dir, base + self._name_tail)
 
     def _run_concat(self):
         """Concatenate all input files into a single output using FFmpeg concat demuxer."""
         try:
             os.makedirs(self.output_dir, exist_ok=True)
         except Exception as e:
-            self.encoding_error.emit(f"Cannot create output directory: {e}")
-            self.encoding_done.emit()
+            self.encoding_terminated.emit(f"Cannot create output directory: {e}")
             return
 
+        error = ""
         # Create concat list file
         list_fd, list_path = tempfile.mkstemp(suffix=".txt", prefix="vcc_concat_")
         try:
-            with os.fdopen(list_fd, "w", encoding="utf-8") as f:
-                for src in self.files:
-                    escaped = src.replace("'", "'\\''")
-                    f.write(f"file '{escaped}'\n")
+            payload = "".join(
+                f"file '{src.translate(_CONCAT_QUOTE_ESCAPE)}'\n" for src in self.files
+            ).encode("utf-8")
+            with os.fdopen(list_fd, "wb") as f:
+                f.write(payload)
 
             # Build output name from first file
             first_base = os.path.splitext(os.path.basename(self.files[0]))[0]
@@ -388,18 +899,20 @@ class EncoderWorker(QThread):
             out_name = f"{first_base}.merged.{ext}"
             dst = os.path.join(self.output_dir, out_name)
 
-            total_duration = 0.0
-            for src in self.files:
-                d = probe_duration(self._ffmpeg_path, src)
-                if d:
-                    total_duration += d
+            # Probe all inputs concurrently rather than one ffprobe at a time;
+            # wall time is then the slowest probe, not the sum of them
+            workers = min(len(self.files), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                durations = pool.map(
+                    lambda src: probe_duration(self._ffmpeg_path, src), self.files
+                )
+                total_duration = sum(d for d in durations if d)
 
             self.file_started.emit(1, 1, out_name)
             self.log_output.emit(f"Concatenating {len(self.files)} files → {out_name}\n")
 
-            ow_flag = "-y" if self.overwrite else "-n"
             args = [
-                self._ffmpeg_path, "-hide_banner", ow_flag,
+                *self._head_args,
                 "-f", "concat", "-safe", "0",
                 "-i", list_path,
                 "-c", "copy",
@@ -409,49 +922,133 @@ class EncoderWorker(QThread):
             cmd_display = " ".join(f'"{a}"' if " " in a else a for a in args)
             self.log_output.emit(f"> {cmd_display}\n\n")
 
-            self._process = subprocess.Popen(
-                args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
-            )
-
-            self._read_output_with_progress(total_duration)
-            self._process.wait()
-            success = self._process.returncode == 0
+            process = self._spawn(1, args)
+            self._read_output_with_progress(process, total_duration, job=1)
+            process.wait()
+            success = process.returncode == 0
 
             if success:
                 self.log_output.emit(f"\nDone -> {out_name}\n")
             else:
-                self.log_output.emit(f"\n[WARNING] FFmpeg exited with code {self._process.returncode}\n")
+                self.log_output.emit(f"\n[WARNING] FFmpeg exited with code {process.returncode}\n")
 
             self.file_finished.emit(1, 1, out_name, success)
         except FileNotFoundError:
-            self.encoding_error.emit(
-                "ffmpeg not found! Please install FFmpeg and ensure ffmpeg.exe is in your system PATH."
-            )
+            error = _FFMPEG_NOT_FOUND
         except Exception as e:
             self.log_output.emit(f"\n[ERROR] {e}\n")
             self.file_finished.emit(1, 1, "merge", False)
         finally:
+            self._release(1)
             try:
                 os.unlink(list_path)
             except Exception:
                 pass
 
-        if not self._cancelled:
+        save_probe_cache()
+        if not error and not self._cancelled:
             self.log_output.emit("=== All done. ===\n")
-        self.encoding_done.emit()
-
-    def _read_output_with_progress(self, total_duration: float):
-        """Read FFmpeg output line by line, emitting each line to the terminal."""
-        for line in self._process.stdout:
+        self.encoding_terminated.emit(error)
+
+    def _read_output_with_progress(self, process: subprocess.Popen,
+                                   total_duration: float, prefix: str = "",
+                                   job: int = 0):
+        """Read FFmpeg output in raw chunks and forward it to the terminal.
+
+        Each chunk is decoded once.  Regular lines are batched into a single
+        ``log_output`` emission once ``_LOG_BATCH_SIZE`` characters or
+        ``_LOG_BATCH_INTERVAL`` seconds have accumulated.  ``-progress``
+        key=value lines are pulled out with one regex pass; each complete
+        block updates ``file_progress`` and becomes a one-line summary
+        that is emitted at most every ``_LOG_FLUSH_INTERVAL`` seconds.
+
+        *prefix* tags every line with its file index when several files
+        are encoded at once, so interleaved output stays readable.  *job*
+        is the key *process* was spawned under (see _report_progress).
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        stream = process.stdout
+        pending = ""   # trailing partial line carried over to the next chunk
+        progress = ""  # latest progress summary not shown yet
+        stats: dict[str, str] = {}  # -progress fields of the current block
+        buf: list[str] = []
+        buf_len = 0
+        last_flush = time.monotonic()
+        nl_prefix = "\n" + prefix
+
+        def tag(text: str) -> str:
+            # Tag lines with one str.replace instead of a Python loop
+            if not prefix:
+                return text
+            body = text[:-1] if text.endswith("\n") else text
+            return prefix + body.replace("\n", nl_prefix) + text[len(body):]
+
+        while True:
             if self._cancelled:
-                self._process.terminate()
+                process.terminate()
+                break
+            raw = stream.read1(_READ_CHUNK)
+            if not raw:
                 break
-            self.log_output.emit(line)
+
+            text = pending + decoder.decode(raw)
+            # Hold back a trailing CR in case its LF arrives in the next chunk
+            held_cr = text.endswith("\r")
+            if held_cr:
+                text = text[:-1]
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            head, sep, pending = text.rpartition("\n")
+            if held_cr:
+                pending += "\r"
+
+            now = time.monotonic()
+            if sep:
+                block = head + "\n"
+                fields = _PROGRESS_FIELD_RE.findall(block)
+                if fields:
+                    block = _PROGRESS_FIELD_RE.sub("", block)
+                if block:
+                    buf.append(progress + block)
+                    buf_len += len(buf[-1])
+                    progress = ""
+                for key, value in fields:
+                    if key not in _PROGRESS_KEYS:
+                        continue
+                    stats[key] = value
+                    if key == "progress":
+                        progress = self._report_progress(stats, total_duration, job)
+                        stats = {}
+
+            elapsed = now - last_flush
+            if ((buf and (buf_len >= _LOG_BATCH_SIZE or elapsed >= _LOG_BATCH_INTERVAL))
+                    or (progress and elapsed >= _LOG_FLUSH_INTERVAL)):
+                buf.append(progress)
+                self.log_output.emit(tag("".join(buf)))
+                buf.clear()
+                buf_len = 0
+                progress = ""
+                last_flush = now
+
+        buf.append(progress)
+        buf.append((pending + decoder.decode(b"", final=True)).replace("\r", "\n"))
+        out = "".join(buf)
+        if out:
+            self.log_output.emit(tag(out))
+
+    def _report_progress(self, stats: dict[str, str], total_duration: float,
+                         job: int = 0) -> str:
+        """Emit ``file_progress`` for one -progress block; return a summary line.
+
+        With several encodes running, only the lowest-index one reports, so
+        the status bar follows one file instead of flickering between them.
+        """
+        percent, speed, eta, line = _summarize_progress(stats, total_duration)
+        if total_duration > 0:
+            with self._proc_lock:
+                lowest = min(self._processes, default=job)
+            if job <= lowest:
+                self.file_progress.emit(job, percent, speed, eta)
+        return line
 
     def run(self):
         # If concatenate mode, use concat method
@@ -463,86 +1060,410 @@ class EncoderWorker(QThread):
         try:
             os.makedirs(self.output_dir, exist_ok=True)
         except Exception as e:
-            self.encoding_error.emit(f"Cannot create output directory: {e}")
-            self.encoding_done.emit()
+            self.encoding_terminated.emit(f"Cannot create output directory: {e}")
             return
 
-        for idx, src in enumerate(self.files, 1):
-            if self._cancelled:
-                self.log_output.emit("\n--- Encoding cancelled by user ---\n")
-                break
+        # One directory listing instead of a stat per file for the
+        # skip-existing check
+        if not self.overwrite:
+            try:
+                with os.scandir(self.output_dir) as it:
+                    self._existing_outputs = {os.path.normcase(e.name) for e in it}
+            except OSError:
+                self._existing_outputs = None
+
+        self._job_state = JobStateDB(_JOB_STATE_PATH)
+
+        if self.copy_compliant:
+            self._find_compliant_inputs()
+        self._init_hw_scale()
+
+        # Probe durations ahead of the encodes, in file order, one prober
+        # per encode slot so parallel encodes rarely wait for ffprobe
+        probe_pool = ThreadPoolExecutor(max_workers=self.parallel_jobs)
+        self._duration_futures = {
+            src: probe_pool.submit(self._expected_duration, src)
+            for src in self._files_to_probe()
+        }
+        try:
+            # Each file produces an independent output, so run up to
+            # ``parallel_jobs`` ffmpeg children side by side.
+            with ThreadPoolExecutor(max_workers=self.parallel_jobs) as pool:
+                futures = [
+                    pool.submit(self._encode_group, job, total) if len(job) > 1
+                    else pool.submit(self._encode_one, job[0][0], total, job[0][1])
+                    for job in self._plan_jobs(list(enumerate(self.files, 1)))
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except FileNotFoundError:
+                        self._cancelled = True
+                        self.cancel()
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        self.encoding_terminated.emit(_FFMPEG_NOT_FOUND)
+                        return
+        finally:
+            probe_pool.shutdown(wait=False, cancel_futures=True)
+            self._job_state.close()
 
-            filename = os.path.basename(src)
-            dst = self.make_output_name(src)
+        save_probe_cache()
+        if self._cancelled:
+            self.log_output.emit("\n--- Encoding cancelled by user ---\n")
+        else:
+            self.log_output.emit("=== All done. ===\n")
+        self.encoding_terminated.emit("")
 
-            if os.path.exists(dst) and not self.overwrite:
-                self.log_output.emit(f"[{idx}/{total}] SKIP (exists): {filename}\n")
-                self.file_finished.emit(idx, total, filename, True)
+    def _target_codec_name(self) -> str:
+        """Return the ffprobe codec_name the selected encoder produces."""
+        if self._gpu_enc:
+            return self.codec.split("_", 1)[0]
+        return _ENCODER_CODEC_NAMES.get(self.codec, "")
+
+    def _find_compliant_inputs(self) -> None:
+        """Fill ``_copy_video`` with the inputs whose video needs no re-encode.
+
+        Only untrimmed, uncropped files qualify, and only when no setting
+        other than codec, size and pixel format would change the video.
+        """
+        target = self._target_codec_name()
+        if (not target or (self.fps and self.fps.strip())
+                or (self.bitrate and self.bitrate.strip())
+                or self.film_grain > 0 or self.sharpness > 0):
+            return
+        candidates = [
+            src for src in dict.fromkeys(self.files)
+            if src not in self._trims and not self.file_crops.get(src)
+        ]
+        if not candidates:
+            return
+
+        self.log_output.emit(
+            f"Checking {len(candidates)} file(s) for video already in the target format...\n"
+        )
+        # ffprobe mostly waits on I/O, so probe several files at once
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+            streams = pool.map(
+                functools.partial(probe_video_stream, self._ffmpeg_path), candidates
+            )
+            for src, info in zip(candidates, streams):
+                if (info and info.get("codec_name") == target
+                        and info.get("width") == self.width
+                        and info.get("height") == self.height
+                        and (not self.pix_fmt or info.get("pix_fmt") == self.pix_fmt)):
+                    self._copy_video.add(src)
+
+        if self._copy_video:
+            n = sum(1 for src in self.files if src in self._copy_video)
+            self.log_output.emit(
+                f"{n}/{len(self.files)} file(s) already compliant — copying their video stream\n\n"
+            )
+
+    def _keep_existing(self, dst: str) -> bool:
+        """Return True if *dst* is a finished output that must not be redone.
+
+        A partial output left by a cancelled or crashed run is deleted so
+        its file is encoded again.  The name is also dropped from the
+        start-of-run listing, so a later check for the same file (e.g. a
+        group falling back to _encode_one) sees it as missing.
+        """
+        if self._is_finished(dst):
+            return True
+        if self.overwrite or not self._output_exists(dst):
+            return False
+        try:
+            os.remove(dst)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return True
+        if self._existing_outputs is not None:
+            self._existing_outputs.discard(os.path.normcase(os.path.basename(dst)))
+        self.log_output.emit(f"Redoing incomplete output: {os.path.basename(dst)}\n")
+        return False
+
+    def _is_finished(self, dst: str) -> bool:
+        """Return True if *dst* is kept from an earlier, finished run."""
+        if self.overwrite or not self._output_exists(dst):
+            return False
+        return self._job_state is None or not self._job_state.is_incomplete(dst)
+
+    def _output_exists(self, dst: str) -> bool:
+        """Return True if *dst* already existed when the run started."""
+        if self._existing_outputs is None:
+            return os.path.exists(dst)
+        return os.path.normcase(os.path.basename(dst)) in self._existing_outputs
+
+    def _plan_jobs(self, items: list[tuple[int, str]]) -> list[list[tuple[int, str]]]:
+        """Split ``(idx, src)`` items into the jobs run by one ffmpeg each."""
+        step = self.files_per_process
+        if step == 1:
+            return [[item] for item in items]
+        if step > 1:
+            return [items[i:i + step] for i in range(0, len(items), step)]
+
+        # Auto: batch runs of small, untrimmed clips.  GPU encoders are left
+        # alone since every output would open its own hardware session.
+        if self._gpu_enc:
+            return [[item] for item in items]
+        jobs: list[list[tuple[int, str]]] = []
+        run: list[tuple[int, str]] = []
+        for item in items:
+            src = item[1]
+            try:
+                small = src not in self._trims and os.path.getsize(src) < _AUTO_GROUP_BYTES
+            except OSError:
+                small = False
+            if not small:
+                if run:
+                    jobs.append(run)
+                    run = []
+                jobs.append([item])
                 continue
+            run.append(item)
+            if len(run) == _AUTO_GROUP_MAX:
+                jobs.append(run)
+                run = []
+        if run:
+            jobs.append(run)
+        return jobs
+
+    def _files_to_probe(self) -> list[str]:
+        """Return the inputs whose duration is prefetched, in file order.
+
+        Finished outputs are skipped, and remuxed inputs were already timed
+        by the compliance probe (a cache hit in _duration_of).
+        """
+        return [
+            src for src in dict.fromkeys(self.files)
+            if src not in self._copy_video
+            and not self._is_finished(self.make_output_name(src))
+        ]
 
-            self.file_started.emit(idx, total, filename)
-            self.log_output.emit(f"[{idx}/{total}] ENCODE: {filename}\n")
+    def _duration_of(self, src: str) -> float:
+        """Return the prefetched expected duration of *src* (see run)."""
+        future = self._duration_futures.get(src)
+        if future is None or future.cancelled():
+            return self._expected_duration(src)
+        return future.result()
 
-            # Probe duration for progress reporting
-            total_duration = probe_duration(self._ffmpeg_path, src) or 0.0
-            # Adjust for per-file trimming
-            trim_start, trim_end = self.file_trims.get(src, ("", ""))
-            if trim_start and trim_start.strip():
-                try:
-                    start_sec = _parse_time_to_seconds(trim_start)
-                except Exception:
-                    start_sec = 0.0
-            else:
+    def _expected_duration(self, src: str) -> float:
+        """Return the encoded length of *src* after per-file trimming.
+
+        ffprobe is only run when the trim end is not given explicitly.
+        """
+        trim_start, trim_end = self._trims.get(src, ("", ""))
+        if trim_start:
+            try:
+                start_sec = _parse_time_to_seconds(trim_start)
+            except Exception:
                 start_sec = 0.0
-            if trim_end and trim_end.strip():
+        else:
+            start_sec = 0.0
+        if trim_end:
+            try:
+                end_sec = _parse_time_to_seconds(trim_end)
+                return max(0.0, end_sec - start_sec)
+            except Exception:
+                pass
+
+        total_duration = probe_duration(self._ffmpeg_path, src) or 0.0
+        if start_sec > 0 and total_duration > 0:
+            total_duration = max(0.0, total_duration - start_sec)
+        return total_duration
+
+    def _encode_one(self, idx: int, total: int, src: str) -> None:
+        """Encode a single file. Runs on a pool thread."""
+        if self._cancelled:
+            return
+
+        filename = os.path.basename(src)
+        dst = self.make_output_name(src)
+
+        if self._keep_existing(dst):
+            self.log_output.emit(f"[{idx}/{total}] SKIP (exists): {filename}\n")
+            self.file_finished.emit(idx, total, filename, True)
+            return
+
+        self.file_started.emit(idx, total, filename)
+        action = "REMUX" if src in self._copy_video else "ENCODE"
+        self.log_output.emit(f"[{idx}/{total}] {action}: {filename}\n")
+
+        total_duration = self._duration_of(src)
+        hw_scale = self._can_hw_scale(src)
+        cpus = self._cpu_slots.get() if self._cpu_slots else None
+        prefix = f"[{idx}/{total}] " if self.parallel_jobs > 1 else ""
+        job_state = self._job_state
+        success = False
+        try:
+            if job_state:
+                job_state.mark(dst, IN_PROGRESS)
+            threads = self._threads_for(cpus, 1)
+            returncode = self._run_ffmpeg(
+                idx, self.build_ffmpeg_args(src, dst, hw_scale, threads),
+                cpus, total_duration, prefix,
+            )
+            if returncode != 0 and hw_scale and not self._cancelled:
+                # e.g. the GPU cannot decode this input, so its frames
+                # never reach the GPU scaler
+                self.log_output.emit(
+                    f"\n[WARNING] GPU scaling failed on: {filename}; retrying with CPU scaling\n"
+                )
                 try:
-                    end_sec = _parse_time_to_seconds(trim_end)
-                    total_duration = max(0.0, end_sec - start_sec)
-                except Exception:
+                    os.remove(dst)
+                except OSError:
                     pass
-            elif start_sec > 0 and total_duration > 0:
-                total_duration = max(0.0, total_duration - start_sec)
-
-            args = self.build_ffmpeg_args(src, dst)
-            cmd_display = " ".join(f'"{a}"' if " " in a else a for a in args)
-            self.log_output.emit(f"> {cmd_display}\n\n")
+                returncode = self._run_ffmpeg(
+                    idx, self.build_ffmpeg_args(src, dst, threads=threads),
+                    cpus, total_duration, prefix,
+                )
+            success = returncode == 0
 
-            try:
-                self._process = subprocess.Popen(
-                    args,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            if not success and not self._cancelled:
+                self.log_output.emit(
+                    f"\n[WARNING] FFmpeg exited with code {returncode} on: {filename}\n"
                 )
+            elif success:
+                self.log_output.emit(f"\nDone -> {os.path.basename(dst)}\n")
 
-                self._read_output_with_progress(total_duration)
+            self.file_finished.emit(idx, total, filename, success)
 
-                self._process.wait()
-                success = self._process.returncode == 0
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self.log_output.emit(f"\n[ERROR] {e}\n")
+            self.file_finished.emit(idx, total, filename, False)
+        finally:
+            if job_state:
+                if success:
+                    job_state.mark_done(dst)
+                else:
+                    job_state.mark(dst, FAILED)
+            if cpus:
+                self._cpu_slots.put(cpus)
+
+        self.log_output.emit("\n")
+
+    def _threads_for(self, cpus: list[int] | None, outputs: int) -> int:
+        """Return the -threads value of each of *outputs* encoders.
+
+        A pinned process splits its CPU block between its outputs, so
+        ffmpeg's thread pools match the affinity mask.  An unpinned group
+        splits this job's share of the machine instead; otherwise every
+        output would size its pools to all cores.  0 leaves ffmpeg's
+        default (a single unpinned output).
+        """
+        if cpus:
+            return max(1, len(cpus) // outputs)
+        if outputs == 1:
+            return 0
+        share = (os.cpu_count() or 1) // self.parallel_jobs
+        return max(1, share // outputs)
+
+    def _run_ffmpeg(self, key: int, args: list[str], cpus: list[int] | None,
+                    total_duration: float, prefix: str) -> int:
+        """Run one ffmpeg command to completion and return its exit code."""
+        cmd_display = " ".join(f'"{a}"' if " " in a else a for a in args)
+        self.log_output.emit(f"> {cmd_display}\n\n")
+
+        process = self._spawn(key, args, cpus)
+        try:
+            self._read_output_with_progress(process, total_duration, prefix, key)
+            process.wait()
+        finally:
+            self._release(key)
+        return process.returncode
 
-                if not success and not self._cancelled:
-                    self.log_output.emit(
-                        f"\n[WARNING] FFmpeg exited with code {self._process.returncode} on: {filename}\n"
-                    )
-                elif success:
-                    self.log_output.emit(f"\nDone -> {os.path.basename(dst)}\n")
+    def _encode_group(self, items: list[tuple[int, str]], total: int) -> None:
+        """Encode several files with a single ffmpeg process. Runs on a pool thread."""
+        if self._cancelled:
+            return
 
-                self.file_finished.emit(idx, total, filename, success)
+        jobs = []
+        for idx, src in items:
+            dst = self.make_output_name(src)
+            if self._keep_existing(dst):
+                filename = os.path.basename(src)
+                self.log_output.emit(f"[{idx}/{total}] SKIP (exists): {filename}\n")
+                self.file_finished.emit(idx, total, filename, True)
+                continue
+            jobs.append((idx, src, dst))
+
+        # Stream copies get their own process (no shared filter graph)
+        if self._copy_video:
+            for idx, src, _dst in jobs:
+                if src in self._copy_video:
+                    self._encode_one(idx, total, src)
+            jobs = [job for job in jobs if job[1] not in self._copy_video]
+
+        if not jobs:
+            return
+        if len(jobs) == 1:
+            idx, src, _dst = jobs[0]
+            self._encode_one(idx, total, src)
+            return
+
+        for idx, src, _dst in jobs:
+            filename = os.path.basename(src)
+            self.file_started.emit(idx, total, filename)
+            self.log_output.emit(f"[{idx}/{total}] ENCODE: {filename}\n")
+
+        # The outputs are encoded side by side, so the longest one sets the pace
+        total_duration = max(self._duration_of(src) for _idx, src, _dst in jobs)
 
-            except FileNotFoundError:
-                self.encoding_error.emit(
-                    "ffmpeg not found! Please install FFmpeg and ensure ffmpeg.exe is in your system PATH."
+        first, last = jobs[0][0], jobs[-1][0]
+        prefix = f"[{first}-{last}/{total}] " if self.parallel_jobs > 1 else ""
+        success = retry = False
+        job_state = self._job_state
+        cpus = self._cpu_slots.get() if self._cpu_slots else None
+        try:
+            if job_state:
+                for _idx, _src, dst in jobs:
+                    job_state.mark(dst, IN_PROGRESS)
+            args = self.build_group_ffmpeg_args(
+                [(src, dst) for _idx, src, dst in jobs],
+                self._threads_for(cpus, len(jobs)),
+            )
+            returncode = self._run_ffmpeg(first, args, cpus, total_duration, prefix)
+            success = returncode == 0
+            retry = not success and not self._cancelled
+
+            if retry:
+                self.log_output.emit(
+                    f"\n[WARNING] FFmpeg exited with code {returncode} "
+                    f"on files {first}-{last}; retrying them one at a time\n"
                 )
-                self.encoding_done.emit()
-                return
-            except Exception as e:
-                self.log_output.emit(f"\n[ERROR] {e}\n")
-                self.file_finished.emit(idx, total, filename, False)
+            elif success:
+                for _idx, _src, dst in jobs:
+                    self.log_output.emit(f"\nDone -> {os.path.basename(dst)}\n")
+
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self.log_output.emit(f"\n[ERROR] {e}\n")
+        finally:
+            if job_state:
+                for _idx, _src, dst in jobs:
+                    if success:
+                        job_state.mark_done(dst)
+                    else:
+                        job_state.mark(dst, FAILED)
+            if cpus:
+                self._cpu_slots.put(cpus)
+
+        if retry:
+            # One bad input fails the whole group.  Drop the partial outputs
+            # and encode each file on its own so the good ones still succeed.
+            for _idx, _src, dst in jobs:
+                try:
+                    os.remove(dst)
+                except OSError:
+                    pass
+            for idx, src, _dst in jobs:
+                self._encode_one(idx, total, src)
+            return
 
-            self.log_output.emit("\n")
+        for idx, src, _dst in jobs:
+            self.file_finished.emit(idx, total, os.path.basename(src), success)
 
-        if not self._cancelled:
-            self.log_output.emit("=== All done. ===\n")
-        self.encoding_done.emit()
+        self.log_output.emit("\n")
@@ -6,8 +6,6 @@ are available on the current system (NVIDIA NVENC, AMD AMF, Intel QSV).
 """
 
 import os
-import glob
-import shutil
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -213,45 +211,21 @@ ALL_GPU_ENCODERS: list[GpuEncoder] = [
 
 _GPU_ENCODER_MAP: dict[str, GpuEncoder] = {e.name: e for e in ALL_GPU_ENCODERS}
 
-
-# ── FFmpeg location (reuse from encoder.py) ────────────────────────────
-
-def _find_ffmpeg() -> str | None:
-    """Locate ffmpeg executable."""
-    path = shutil.which("ffmpeg")
-    if path:
-        return path
-
-    winget_links = os.path.expandvars(
-        r"%LOCALAPPDATA%\Microsoft\WinGet\Links\ffmpeg.exe"
-    )
-    if os.path.isfile(winget_links):
-        return winget_links
-
-    winget_pkgs = os.path.expandvars(
-        r"%LOCALAPPDATA%\Microsoft\WinGet\Packages"
-    )
-    for pattern in [
-        os.path.join(winget_pkgs, "Gyan.FFmpeg*", "ffmpeg-*", "bin", "ffmpeg.exe"),
-        os.path.join(winget_pkgs, "Gyan.FFmpeg*", "ffmpeg.exe"),
-    ]:
-        matches = glob.glob(pattern)
-        if matches:
-            return matches[0]
-
-    for candidate in [
-        r"C:\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
-    ]:
-        if os.path.isfile(candidate):
-            return candidate
-
-    return None
+# Codec family of the CPU encoders that have a hardware counterpart
+_CPU_CODEC_FAMILY: dict[str, str] = {
+    "libx264": "H.264",
+    "libx265": "H.265",
+    "libsvtav1": "AV1",
+    "libaom-av1": "AV1",
+    "librav1e": "AV1",
+}
 
 
 # ── Probing ────────────────────────────────────────────────────────────
 
+# Hide the console window of every ffmpeg / ffprobe child on Windows
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0
+
 _cached_result: list[GpuEncoder] | None = None
 
 
@@ -267,7 +241,9 @@ def probe_available_gpu_encoders(force: bool = False) -> list[GpuEncoder]:
     if _cached_result is not None and not force:
         return _cached_result
 
-    ffmpeg = _find_ffmpeg()
+    # encoder.py imports this module, hence the deferred import
+    from vcc.core.encoder import find_ffmpeg
+    ffmpeg = find_ffmpeg()
     if not ffmpeg:
         _cached_result = []
         return _cached_result
@@ -277,7 +253,7 @@ def probe_available_gpu_encoders(force: bool = False) -> list[GpuEncoder]:
         result = subprocess.run(
             [ffmpeg, "-hide_banner", "-encoders"],
             capture_output=True, text=True, timeout=10,
-            creationflags=0x08000000 if os.name == "nt" else 0,  # CREATE_NO_WINDOW
+            creationflags=CREATE_NO_WINDOW,
         )
         output = result.stdout
     except Exception:
@@ -324,7 +300,7 @@ def _test_encoder(ffmpeg: str, encoder_name: str) -> bool:
             result = subprocess.run(
                 cmd,
                 capture_output=True, text=True, timeout=5,
-                creationflags=0x08000000 if os.name == "nt" else 0,
+                creationflags=CREATE_NO_WINDOW,
             )
             if result.returncode == 0:
                 return True
@@ -341,3 +317,19 @@ def get_gpu_encoder(name: str) -> GpuEncoder | None:
 def is_gpu_encoder(name: str) -> bool:
     """Return True if *name* is a known GPU encoder."""
     return name in _GPU_ENCODER_MAP
+
+
+def gpu_equivalent(cpu_codec: str, available: list[GpuEncoder]) -> GpuEncoder | None:
+    """Return the first *available* GPU encoder in *cpu_codec*'s family.
+
+    *available* is the (display-ordered) result of
+    probe_available_gpu_encoders().  Returns None when the CPU codec has
+    no hardware counterpart or none was detected.
+    """
+    family = _CPU_CODEC_FAMILY.get(cpu_codec)
+    if family is None:
+        return None
+    for enc in available:
+        if enc.codec_family == family:
+            return enc
+    return None
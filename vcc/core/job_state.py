@@ -0,0 +1,76 @@
+"""
+Persistent per-output job state for VCC.
+
+Records which outputs were started but never finished, so a batch that was
+cancelled or crashed redoes those files on the next run instead of skipping
+their partial outputs as already encoded.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+# Output is in progress (or the run died before it finished)
+IN_PROGRESS = "in_progress"
+# ffmpeg exited with an error or was cancelled
+FAILED = "failed"
+
+
+class JobStateDB:
+    """SQLite table of unfinished outputs, shared by the encoder pool threads.
+
+    Finished outputs are removed from the table, so it only ever holds the
+    handful of files that need to be redone.  Every method is a no-op when
+    the database cannot be opened (e.g. a read-only cache directory).
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(
+                path, isolation_level=None, check_same_thread=False, timeout=5,
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "output TEXT PRIMARY KEY, status TEXT NOT NULL, updated_at REAL)"
+            )
+        except (OSError, sqlite3.Error):
+            self.close()
+
+    @staticmethod
+    def _key(output: str) -> str:
+        return os.path.normcase(os.path.abspath(output))
+
+    def _execute(self, sql: str, params: tuple) -> list[tuple]:
+        with self._lock:
+            if self._conn is None:
+                return []
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            except sqlite3.Error:
+                return []
+
+    def is_incomplete(self, output: str) -> bool:
+        """Return True if *output* was started by a run that never finished it."""
+        return bool(self._execute(
+            "SELECT 1 FROM jobs WHERE output = ?", (self._key(output),)
+        ))
+
+    def mark(self, output: str, status: str) -> None:
+        """Record *output* as IN_PROGRESS or FAILED."""
+        self._execute(
+            "INSERT OR REPLACE INTO jobs (output, status, updated_at) VALUES (?, ?, ?)",
+            (self._key(output), status, time.time()),
+        )
+
+    def mark_done(self, output: str) -> None:
+        self._execute("DELETE FROM jobs WHERE output = ?", (self._key(output),))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,6 +4,8 @@ Main window for Video Codec Converter (VCC).
 
 import os
 import json
+import threading
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QScrollArea,
     QLabel, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit,
@@ -11,8 +13,12 @@ from PyQt6.QtWidgets import (
     QProgressBar, QSplitter, QListWidget, QAbstractItemView,
     QToolButton, QSizePolicy, QCheckBox, QApplication, QListWidgetItem,
     QDialog, QTimeEdit, QDialogButtonBox, QFormLayout, QInputDialog,
+    QStackedWidget,
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QEvent, QSettings, QSignalBlocker, QTime, QTimer,
+    QMimeData, QObject, QUrl, pyqtSignal,
 )
-from PyQt6.QtCore import Qt, QSize, QEvent, QSettings, QTime, QMimeData, QUrl
 from PyQt6.QtGui import QAction, QFont, QIcon, QDragEnterEvent, QDropEvent
 
 from vcc.core.codecs import CODECS
@@ -20,27 +26,37 @@ from vcc.core.pixel_formats import PIXEL_FORMATS, query_encoder_pix_fmts
 from vcc.core.encoder import EncoderWorker, detect_crop, find_ffmpeg
 from vcc.core.gpu_detect import (
     probe_available_gpu_encoders, get_gpu_encoder, is_gpu_encoder, GpuEncoder,
+    gpu_equivalent,
 )
 from vcc.ui.terminal_widget import TerminalWidget
-from vcc.ui.help_dialogs import (
-    CodecHelpDialog, PixelFormatHelpDialog, AudioHelpDialog,
-    ResolutionHelpDialog, FPSHelpDialog, BitrateHelpDialog, AboutDialog,
-    GPUEncodingHelpDialog, OutputFormatHelpDialog,
-    FilmGrainHelpDialog, SharpnessHelpDialog,
-)
-from vcc.ui.themes import (
-    LIGHT_THEME, DARK_THEME,
-    LIGHT_MENUBAR_STYLE, DARK_MENUBAR_STYLE,
-    LIGHT_GROUP_STYLE, DARK_GROUP_STYLE,
-    LIGHT_HELP_BUTTON_STYLE, DARK_HELP_BUTTON_STYLE,
-    LIGHT_START_BUTTON_STYLE, DARK_START_BUTTON_STYLE,
-    LIGHT_CANCEL_BUTTON_STYLE, DARK_CANCEL_BUTTON_STYLE,
-    LIGHT_PROGRESS_STYLE, DARK_PROGRESS_STYLE,
-    LIGHT_FILELIST_STYLE, DARK_FILELIST_STYLE,
-    LIGHT_STATUSBAR_STYLE, DARK_STATUSBAR_STYLE,
-    LIGHT_FILECOUNT_STYLE, DARK_FILECOUNT_STYLE,
-    get_arrow_stylesheet,
+from vcc.ui.themes import build_stylesheet
+
+# Combo box entries, formatted once at import: (label, data)
+_CODEC_ITEMS = tuple(
+    (f"{info['display']}  ({ffname})", ffname) for ffname, info in CODECS.items()
 )
+# Pixel formats keep their full PIXEL_FORMATS row for per-encoder filtering
+_PIXFMT_ITEMS = tuple((f"{pf[0]}  —  {pf[1]}", pf) for pf in PIXEL_FORMATS)
+
+
+class _GpuProbeRelay(QObject):
+    """Carries the GPU probe result from its thread to the GUI thread.
+
+    It is module-level rather than a signal on the window, so a window
+    closed while the probe runs is never emitted on after deletion; Qt
+    drops the connection to the deleted window instead.
+    """
+    done = pyqtSignal(list)
+
+
+_gpu_probe_relay: _GpuProbeRelay | None = None
+
+
+def _probe_relay() -> _GpuProbeRelay:
+    global _gpu_probe_relay
+    if _gpu_probe_relay is None:
+        _gpu_probe_relay = _GpuProbeRelay()
+    return _gpu_probe_relay
 
 
 # ---------------------------------------------------------------------------
@@ -86,16 +102,73 @@ class NoScrollComboBox(QComboBox):
 # ---------------------------------------------------------------------------
 # Tooltip button helper
 # ---------------------------------------------------------------------------
-def make_help_button(tooltip_text: str, dark: bool = False) -> QToolButton:
+def make_help_button(tooltip_text: str) -> QToolButton:
     """Create a small '?' button with a rich tooltip."""
     btn = QToolButton()
+    btn.setObjectName("vccHelp")  # styled by the application stylesheet
     btn.setText(" ? ")
     btn.setFixedSize(QSize(22, 22))
     btn.setToolTip(tooltip_text)
-    btn.setStyleSheet(DARK_HELP_BUTTON_STYLE if dark else LIGHT_HELP_BUTTON_STYLE)
     return btn
 
 
+def make_field_label(text: str) -> QLabel:
+    """Create the fixed-width caption at the start of an encoding settings row."""
+    lbl = QLabel(text)
+    lbl.setObjectName("vccFieldLabel")  # width set by the application stylesheet
+    return lbl
+
+
+# ---------------------------------------------------------------------------
+# List batching helper
+# ---------------------------------------------------------------------------
+@contextmanager
+def _list_batch(lw: QListWidget):
+    """Suspend painting and signals of *lw* while it is mutated in bulk."""
+    lw.setUpdatesEnabled(False)
+    lw.blockSignals(True)
+    try:
+        yield lw
+    finally:
+        lw.blockSignals(False)
+        lw.setUpdatesEnabled(True)
+        lw.update()
+
+
+def _iter_video_files(root: str, exts) -> list[str]:
+    """Return the files under *root* whose extension is in *exts*.
+
+    Directories are visited top-down, depth first, with each directory's
+    files sorted by name.  Built on ``os.scandir`` so the directory
+    entries' cached type is used instead of a stat per file.  Unreadable
+    directories are skipped, as ``os.walk`` does.
+    """
+    found = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        files = []
+        subdirs = []
+        for e in entries:
+            if e.is_dir():
+                if not e.is_symlink():  # os.walk does not follow links either
+                    subdirs.append(e.path)
+            else:
+                name = e.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in exts:
+                    files.append((name, e.path))
+        files.sort()
+        found.extend(path for _name, path in files)
+        subdirs.sort(reverse=True)
+        stack.extend(subdirs)
+    return found
+
+
 # ---------------------------------------------------------------------------
 # Trim Dialog
 # ---------------------------------------------------------------------------
@@ -282,6 +355,7 @@ class CodecParamWidget(QWidget):
             self.editor.setMaximum(param_def.get("max", 100))
             self.editor.setValue(param_def.get("default", 0))
             self.editor.setFixedWidth(100)
+            self._get = lambda: str(self.editor.value())
         elif ptype == "choice":
             self.editor = NoScrollComboBox()
             choices = param_def.get("choices", [])
@@ -293,10 +367,12 @@ class CodecParamWidget(QWidget):
             if idx >= 0:
                 self.editor.setCurrentIndex(idx)
             self.editor.setFixedWidth(140)
+            self._get = lambda: self.editor.currentData() or ""
         else:
             self.editor = QLineEdit()
             self.editor.setText(str(param_def.get("default", "")))
             self.editor.setFixedWidth(140)
+            self._get = lambda: self.editor.text().strip()
 
         layout.addWidget(self.editor)
 
@@ -307,18 +383,86 @@ class CodecParamWidget(QWidget):
         layout.addStretch()
 
     def get_value(self) -> str:
-        if isinstance(self.editor, QSpinBox):
-            return str(self.editor.value())
-        elif isinstance(self.editor, QComboBox):
-            return self.editor.currentData() or ""
-        else:
-            return self.editor.text().strip()
+        return self._get()
 
 
 # ---------------------------------------------------------------------------
 # Main Window
 # ---------------------------------------------------------------------------
 class MainWindow(QMainWindow):
+    # Combo box presets, shared by every window: (label, value)
+    _OUTPUT_FORMATS = (
+        ("Auto", ""),
+        ("MKV", "mkv"),
+        ("MP4", "mp4"),
+        ("WebM", "webm"),
+        ("AVI", "avi"),
+        ("MOV", "mov"),
+        ("TS", "ts"),
+        ("FLV", "flv"),
+        ("WMV", "wmv"),
+        ("OGG", "ogg"),
+        ("M4V", "m4v"),
+        ("MPG", "mpg"),
+        ("3GP", "3gp"),
+        ("MXF", "mxf"),
+    )
+    # (name, width, height); width/height are None for "Custom"
+    _RESOLUTION_PRESETS = (
+        ("Custom",       None,  None),
+        ("8K UHD",       7680, 4320),
+        ("4K UHD",       3840, 2160),
+        ("4K DCI",       4096, 2160),
+        ("1440p QHD",    2560, 1440),
+        ("1080p Full HD",1920, 1080),
+        ("720p HD",      1280,  720),
+        ("480p SD",       854,  480),
+        ("480p (4:3)",    640,  480),
+        ("360p",          640,  360),
+        ("240p",          426,  240),
+        ("UWQHD 21:9",  3440, 1440),
+        ("UWHD 21:9",   2560, 1080),
+        ("Vertical 1080×1920", 1080, 1920),
+        ("Square 1080×1080",   1080, 1080),
+    )
+    _RESOLUTION_LABELS = tuple(
+        name if w is None else f"{name}  ({w}×{h})"
+        for name, w, h in _RESOLUTION_PRESETS
+    )
+    # (width, height) -> index of the matching preset
+    _RESOLUTION_INDEX = {
+        (w, h): i for i, (_name, w, h) in enumerate(_RESOLUTION_PRESETS) if w is not None
+    }
+    _FPS_PRESETS = (
+        ("Default (keep original)", ""),
+        ("12 fps",      "12"),
+        ("15 fps",      "15"),
+        ("18 fps",      "18"),
+        ("20 fps",      "20"),
+        ("23.976 fps",  "23.976"),
+        ("24 fps",      "24"),
+        ("25 fps (PAL)","25"),
+        ("29.97 fps",   "29.97"),
+        ("30 fps",      "30"),
+        ("50 fps",      "50"),
+        ("60 fps",      "60"),
+        ("Custom",      "__custom__"),
+    )
+    _BITRATE_PRESETS = (
+        ("Default (CRF mode)",  ""),
+        ("256K",   "256K"),
+        ("384K",   "384K"),
+        ("512K",   "512K"),
+        ("768K",   "768K"),
+        ("1M",     "1M"),
+        ("1.5M",   "1500K"),
+        ("2M",     "2M"),
+        ("5M",     "5M"),
+        ("10M",    "10M"),
+        ("15M",    "15M"),
+        ("20M",    "20M"),
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Video Codec Converter (VCC)")
@@ -338,7 +482,31 @@ class MainWindow(QMainWindow):
         self.setAcceptDrops(True)
 
         self._worker: EncoderWorker | None = None
-        self._codec_param_widgets: list[CodecParamWidget] = []
+        # Encoder threads that have not ended yet, and whether the window
+        # is waiting for them before it closes (see closeEvent)
+        self._live_workers: set[EncoderWorker] = set()
+        self._close_pending = False
+        # Status bar text of each file being encoded, by index
+        self._status_files: dict[int, str] = {}
+        # file_progress updates are shown at most once per 50 ms
+        self._pending_progress: tuple[int, int, str, str] = (0, 0, "", "")
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_file_progress)
+        # Finished-file count, pushed to the batch progress bar every 100 ms
+        self._completed = 0
+        self._finished_timer = QTimer(self)
+        self._finished_timer.setSingleShot(True)
+        self._finished_timer.setInterval(100)
+        self._finished_timer.timeout.connect(self._flush_batch_progress)
+        self._codec_param_widgets: list[QWidget] = []  # rows of the current page
+        # Parameter pages already built: { codec_key: (page, rows) }
+        self._codec_param_pages: dict[str, tuple[QWidget, list[QWidget]]] = {}
+
+        # Paths in the input list, in list order; the keys double as an
+        # O(1) duplicate check.  The list widget only displays them.
+        self._file_paths: dict[str, None] = {}
 
         # Per-file trim state: { filepath: (start_str, end_str) }
         self._file_trims: dict[str, tuple[str, str]] = {}
@@ -350,88 +518,127 @@ class MainWindow(QMainWindow):
         self._settings = QSettings("VCC", "VideoCodecConverter")
         self._dark_mode = self._settings.value("dark_mode", False, type=bool)
 
+        # Filled in by _finish_init once the background probe is done
+        self._gpu_encoders: list[GpuEncoder] = []
+        # Set once the user or a preset picks a codec; the probe then
+        # leaves the selection alone
+        self._codec_user_set = False
+
         self._build_menu_bar()
         self._build_ui()
         self._connect_signals()
 
-        # Trigger initial codec param build
-        self._on_codec_changed()
+        # The codec parameter panel is built on first show (see showEvent)
+        self._params_initialized = False
 
         # Apply saved theme
         self._apply_theme()
 
+        # Probing GPU encoders runs ffmpeg, so keep it off the GUI thread
+        relay = _probe_relay()
+        relay.done.connect(self._finish_init)
+        threading.Thread(
+            target=lambda: relay.done.emit(probe_available_gpu_encoders()),
+            daemon=True,
+        ).start()
+
+    def _finish_init(self, gpu_encoders: list):
+        """Add the detected GPU codecs to the codec list."""
+        self._gpu_encoders = gpu_encoders
+        if not self._gpu_encoders:
+            return
+        self._cmb_codec.insertSeparator(self._cmb_codec.count())
+        for gpu_enc in self._gpu_encoders:
+            self._cmb_codec.addItem(
+                f"\U0001F3AE {gpu_enc.display_name}  ({gpu_enc.name})",
+                gpu_enc.name,
+            )
+
+        # Move to the GPU default unless the user already picked a codec
+        if not self._codec_user_set:
+            idx = self._cmb_codec.findData(self._default_codec())
+            if idx >= 0:
+                self._cmb_codec.setCurrentIndex(idx)
+
+    def _default_codec(self) -> str:
+        """Return libsvtav1, or its hardware equivalent when one was detected."""
+        default_gpu = gpu_equivalent("libsvtav1", self._gpu_encoders)
+        return default_gpu.name if default_gpu else "libsvtav1"
+
     # ------------------------------------------------------------------
     # Menu bar
     # ------------------------------------------------------------------
+    # Menu bar layout: (menu title, entries); an entry is
+    # (action attribute, text, shortcut) or None for a separator
+    _MENU_SPEC = (
+        ("File", (
+            ("_act_open", "Open Files...", "Ctrl+O"),
+            ("_act_open_dir", "Open Input Directory...", None),
+            None,
+            ("_act_exit", "Exit", "Alt+F4"),
+        )),
+        ("Edit", (
+            ("_act_clear_files", "Clear File List", None),
+            ("_act_clear_terminal", "Clear Terminal", None),
+        )),
+        ("Presets", (
+            ("_act_save_preset", "Save Current Settings...", "Ctrl+S"),
+            ("_act_load_preset", "Load Preset...", "Ctrl+L"),
+            ("_act_delete_preset", "Delete Preset...", None),
+        )),
+        ("Settings", (
+            ("_act_dark_mode", "Dark Mode", None),
+            None,
+            ("_act_reset_defaults", "Reset to Defaults", None),
+        )),
+    )
+    # Help menu: (text, help_dialogs class name) or None for a separator
+    _HELP_MENU = (
+        ("Codec Information...", "CodecHelpDialog"),
+        ("Pixel Format Information...", "PixelFormatHelpDialog"),
+        ("Audio Codec Information...", "AudioHelpDialog"),
+        ("Resolution Guide...", "ResolutionHelpDialog"),
+        ("Frame Rate (FPS) Guide...", "FPSHelpDialog"),
+        ("Video Bitrate Guide...", "BitrateHelpDialog"),
+        ("GPU Encoding Guide...", "GPUEncodingHelpDialog"),
+        ("Output Format Guide...", "OutputFormatHelpDialog"),
+        ("Film Grain Guide...", "FilmGrainHelpDialog"),
+        ("Sharpness Guide...", "SharpnessHelpDialog"),
+        None,
+        ("About VCC...", "AboutDialog"),
+    )
+
     def _build_menu_bar(self):
         menubar = self.menuBar()
 
-        # File
-        file_menu = menubar.addMenu("File")
-        self._act_open = QAction("Open Files...", self)
-        self._act_open.setShortcut("Ctrl+O")
-        file_menu.addAction(self._act_open)
-        self._act_open_dir = QAction("Open Input Directory...", self)
-        file_menu.addAction(self._act_open_dir)
-        file_menu.addSeparator()
-        act_exit = QAction("Exit", self)
-        act_exit.setShortcut("Alt+F4")
-        act_exit.triggered.connect(self.close)
-        file_menu.addAction(act_exit)
-
-        # Edit
-        edit_menu = menubar.addMenu("Edit")
-        self._act_clear_files = QAction("Clear File List", self)
-        edit_menu.addAction(self._act_clear_files)
-        self._act_clear_terminal = QAction("Clear Terminal", self)
-        edit_menu.addAction(self._act_clear_terminal)
-
-        # Presets
-        presets_menu = menubar.addMenu("Presets")
-        self._act_save_preset = QAction("Save Current Settings...", self)
-        self._act_save_preset.setShortcut("Ctrl+S")
-        presets_menu.addAction(self._act_save_preset)
-        self._act_load_preset = QAction("Load Preset...", self)
-        self._act_load_preset.setShortcut("Ctrl+L")
-        presets_menu.addAction(self._act_load_preset)
-        self._act_delete_preset = QAction("Delete Preset...", self)
-        presets_menu.addAction(self._act_delete_preset)
-
-        # Settings
-        settings_menu = menubar.addMenu("Settings")
-        self._act_dark_mode = QAction("Dark Mode", self)
+        for title, entries in self._MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                attr, text, shortcut = entry
+                act = QAction(text, self)
+                if shortcut:
+                    act.setShortcut(shortcut)
+                menu.addAction(act)
+                setattr(self, attr, act)
+
+        self._act_exit.triggered.connect(self.close)
         self._act_dark_mode.setCheckable(True)
         self._act_dark_mode.setChecked(self._dark_mode)
-        settings_menu.addAction(self._act_dark_mode)
-        settings_menu.addSeparator()
-        self._act_reset_defaults = QAction("Reset to Defaults", self)
-        settings_menu.addAction(self._act_reset_defaults)
 
         # Help
         help_menu = menubar.addMenu("Help")
-        self._act_help_codec = QAction("Codec Information...", self)
-        help_menu.addAction(self._act_help_codec)
-        self._act_help_pixfmt = QAction("Pixel Format Information...", self)
-        help_menu.addAction(self._act_help_pixfmt)
-        self._act_help_audio = QAction("Audio Codec Information...", self)
-        help_menu.addAction(self._act_help_audio)
-        self._act_help_resolution = QAction("Resolution Guide...", self)
-        help_menu.addAction(self._act_help_resolution)
-        self._act_help_fps = QAction("Frame Rate (FPS) Guide...", self)
-        help_menu.addAction(self._act_help_fps)
-        self._act_help_bitrate = QAction("Video Bitrate Guide...", self)
-        help_menu.addAction(self._act_help_bitrate)
-        self._act_help_gpu = QAction("GPU Encoding Guide...", self)
-        help_menu.addAction(self._act_help_gpu)
-        self._act_help_output_format = QAction("Output Format Guide...", self)
-        help_menu.addAction(self._act_help_output_format)
-        self._act_help_film_grain = QAction("Film Grain Guide...", self)
-        help_menu.addAction(self._act_help_film_grain)
-        self._act_help_sharpness = QAction("Sharpness Guide...", self)
-        help_menu.addAction(self._act_help_sharpness)
-        help_menu.addSeparator()
-        self._act_about = QAction("About VCC...", self)
-        help_menu.addAction(self._act_about)
+        self._help_actions: list[tuple[QAction, str]] = []
+        for entry in self._HELP_MENU:
+            if entry is None:
+                help_menu.addSeparator()
+                continue
+            text, dialog_name = entry
+            act = QAction(text, self)
+            help_menu.addAction(act)
+            self._help_actions.append((act, dialog_name))
 
     # ------------------------------------------------------------------
     # Central UI
@@ -461,24 +668,26 @@ class MainWindow(QMainWindow):
         # File selection row
         file_row = QHBoxLayout()
         self._btn_add_files = QPushButton("Add Files...")
-        self._btn_add_files.setFixedWidth(110)
+        self._btn_add_files.setObjectName("vccFileBtn")
         file_row.addWidget(self._btn_add_files)
         self._btn_add_dir = QPushButton("Add Directory...")
-        self._btn_add_dir.setFixedWidth(130)
+        self._btn_add_dir.setObjectName("vccFileBtn")
         file_row.addWidget(self._btn_add_dir)
         self._btn_remove_selected = QPushButton("Remove Selected")
-        self._btn_remove_selected.setFixedWidth(130)
+        self._btn_remove_selected.setObjectName("vccFileBtn")
         file_row.addWidget(self._btn_remove_selected)
         self._btn_clear_files = QPushButton("Clear All")
-        self._btn_clear_files.setFixedWidth(90)
+        self._btn_clear_files.setObjectName("vccFileBtn")
         file_row.addWidget(self._btn_clear_files)
         file_row.addStretch()
         self._lbl_file_count = QLabel("0 files")
+        self._lbl_file_count.setObjectName("vccFileCount")
         file_row.addWidget(self._lbl_file_count)
         ig_layout.addLayout(file_row)
 
         # File list
         self._file_list = QListWidget()
+        self._file_list.setObjectName("vccFileList")
         self._file_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self._file_list.setMinimumHeight(80)
         self._file_list.setMaximumHeight(150)
@@ -502,23 +711,7 @@ class MainWindow(QMainWindow):
         og_layout.addWidget(QLabel("Format:"))
         self._cmb_output_format = NoScrollComboBox()
         self._cmb_output_format.setFixedWidth(100)
-        self._output_formats = [
-            ("Auto", ""),
-            ("MKV", "mkv"),
-            ("MP4", "mp4"),
-            ("WebM", "webm"),
-            ("AVI", "avi"),
-            ("MOV", "mov"),
-            ("TS", "ts"),
-            ("FLV", "flv"),
-            ("WMV", "wmv"),
-            ("OGG", "ogg"),
-            ("M4V", "m4v"),
-            ("MPG", "mpg"),
-            ("3GP", "3gp"),
-            ("MXF", "mxf"),
-        ]
-        for name, val in self._output_formats:
+        for name, val in self._OUTPUT_FORMATS:
             self._cmb_output_format.addItem(name, val)
         self._cmb_output_format.setCurrentIndex(0)
         og_layout.addWidget(self._cmb_output_format)
@@ -531,6 +724,16 @@ class MainWindow(QMainWindow):
         )
         og_layout.addWidget(self._chk_concat)
 
+        self._chk_copy_compliant = QCheckBox("Copy matching video")
+        self._chk_copy_compliant.setToolTip(
+            "Probe each input first and stream-copy (remux) the video of\n"
+            "files that already have the selected codec, resolution and\n"
+            "pixel format instead of re-encoding them.\n"
+            "Files with trim, crop, a frame rate, bitrate, film grain\n"
+            "or sharpness setting are always re-encoded."
+        )
+        og_layout.addWidget(self._chk_copy_compliant)
+
         top_layout.addWidget(output_group)
 
         # --- Encoding settings ---
@@ -540,33 +743,10 @@ class MainWindow(QMainWindow):
 
         # Row 0: Resolution
         row_res = QHBoxLayout()
-        lbl_preset_res = QLabel("Resolution:")
-        lbl_preset_res.setFixedWidth(100)
-        row_res.addWidget(lbl_preset_res)
+        row_res.addWidget(make_field_label("Resolution:"))
         self._cmb_resolution_preset = NoScrollComboBox()
         self._cmb_resolution_preset.setFixedWidth(180)
-        self._resolution_presets = [
-            ("Custom",       None,  None),
-            ("8K UHD",       7680, 4320),
-            ("4K UHD",       3840, 2160),
-            ("4K DCI",       4096, 2160),
-            ("1440p QHD",    2560, 1440),
-            ("1080p Full HD",1920, 1080),
-            ("720p HD",      1280,  720),
-            ("480p SD",       854,  480),
-            ("480p (4:3)",    640,  480),
-            ("360p",          640,  360),
-            ("240p",          426,  240),
-            ("UWQHD 21:9",  3440, 1440),
-            ("UWHD 21:9",   2560, 1080),
-            ("Vertical 1080×1920", 1080, 1920),
-            ("Square 1080×1080",   1080, 1080),
-        ]
-        for name, w, h in self._resolution_presets:
-            if w is None:
-                self._cmb_resolution_preset.addItem(name)
-            else:
-                self._cmb_resolution_preset.addItem(f"{name}  ({w}×{h})")
+        self._cmb_resolution_preset.addItems(self._RESOLUTION_LABELS)
         # default to 720p HD (index 6)
         self._cmb_resolution_preset.setCurrentIndex(6)
         row_res.addWidget(self._cmb_resolution_preset)
@@ -606,27 +786,16 @@ class MainWindow(QMainWindow):
 
         # Row 1: Codec
         row_codec = QHBoxLayout()
-        lbl_codec = QLabel("Video Codec:")
-        lbl_codec.setFixedWidth(100)
-        row_codec.addWidget(lbl_codec)
+        row_codec.addWidget(make_field_label("Video Codec:"))
         self._cmb_codec = NoScrollComboBox()
         self._cmb_codec.setMinimumWidth(250)
         self._cmb_codec.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
         # CPU codecs
-        for ffname, info in CODECS.items():
-            self._cmb_codec.addItem(f"{info['display']}  ({ffname})", ffname)
-
-        # GPU codecs (auto-detected)
-        self._gpu_encoders = probe_available_gpu_encoders()
-        if self._gpu_encoders:
-            self._cmb_codec.insertSeparator(self._cmb_codec.count())
-            for gpu_enc in self._gpu_encoders:
-                self._cmb_codec.addItem(
-                    f"\U0001F3AE {gpu_enc.display_name}  ({gpu_enc.name})",
-                    gpu_enc.name,
-                )
+        for label, ffname in _CODEC_ITEMS:
+            self._cmb_codec.addItem(label, ffname)
 
+        # Default to AV1; GPU codecs are added by _finish_init
         idx = self._cmb_codec.findData("libsvtav1")
         if idx >= 0:
             self._cmb_codec.setCurrentIndex(idx)
@@ -642,16 +811,13 @@ class MainWindow(QMainWindow):
 
         # Row 2: Pixel format
         row_pixfmt = QHBoxLayout()
-        lbl_pf = QLabel("Pixel Format:")
-        lbl_pf.setFixedWidth(100)
-        row_pixfmt.addWidget(lbl_pf)
+        row_pixfmt.addWidget(make_field_label("Pixel Format:"))
         self._cmb_pixfmt = NoScrollComboBox()
         self._cmb_pixfmt.setEditable(False)
         self._cmb_pixfmt.setMinimumWidth(300)
         self._cmb_pixfmt.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        for pf in PIXEL_FORMATS:
-            ffname, display, bits, sub, alpha, desc = pf
-            self._cmb_pixfmt.addItem(f"{ffname}  —  {display}", ffname)
+        for label, pf in _PIXFMT_ITEMS:
+            self._cmb_pixfmt.addItem(label, pf[0])
         pf_idx = self._cmb_pixfmt.findData("yuv420p10le")
         if pf_idx >= 0:
             self._cmb_pixfmt.setCurrentIndex(pf_idx)
@@ -667,9 +833,7 @@ class MainWindow(QMainWindow):
 
         # Row 3: Audio / Subtitle codec
         row_audio = QHBoxLayout()
-        lbl_audio = QLabel("Audio:")
-        lbl_audio.setFixedWidth(100)
-        row_audio.addWidget(lbl_audio)
+        row_audio.addWidget(make_field_label("Audio:"))
         self._cmb_audio = NoScrollComboBox()
         self._cmb_audio.setEditable(False)
         self._cmb_audio.addItems(["copy", "aac", "libopus", "libvorbis", "ac3", "flac", "pcm_s16le"])
@@ -700,27 +864,10 @@ class MainWindow(QMainWindow):
 
         # Row 4: FPS
         row_fps = QHBoxLayout()
-        lbl_fps = QLabel("Frame Rate:")
-        lbl_fps.setFixedWidth(100)
-        row_fps.addWidget(lbl_fps)
+        row_fps.addWidget(make_field_label("Frame Rate:"))
         self._cmb_fps = NoScrollComboBox()
         self._cmb_fps.setFixedWidth(180)
-        self._fps_presets = [
-            ("Default (keep original)", ""),
-            ("12 fps",      "12"),
-            ("15 fps",      "15"),
-            ("18 fps",      "18"),
-            ("20 fps",      "20"),
-            ("23.976 fps",  "23.976"),
-            ("24 fps",      "24"),
-            ("25 fps (PAL)","25"),
-            ("29.97 fps",   "29.97"),
-            ("30 fps",      "30"),
-            ("50 fps",      "50"),
-            ("60 fps",      "60"),
-            ("Custom",      "__custom__"),
-        ]
-        for name, val in self._fps_presets:
+        for name, val in self._FPS_PRESETS:
             self._cmb_fps.addItem(name, val)
         self._cmb_fps.setCurrentIndex(0)
         row_fps.addWidget(self._cmb_fps)
@@ -749,26 +896,10 @@ class MainWindow(QMainWindow):
 
         # Row 5: Bitrate
         row_bitrate = QHBoxLayout()
-        lbl_br = QLabel("Bitrate:")
-        lbl_br.setFixedWidth(100)
-        row_bitrate.addWidget(lbl_br)
+        row_bitrate.addWidget(make_field_label("Bitrate:"))
         self._cmb_bitrate = NoScrollComboBox()
         self._cmb_bitrate.setFixedWidth(180)
-        self._bitrate_presets = [
-            ("Default (CRF mode)",  ""),
-            ("256K",   "256K"),
-            ("384K",   "384K"),
-            ("512K",   "512K"),
-            ("768K",   "768K"),
-            ("1M",     "1M"),
-            ("1.5M",   "1500K"),
-            ("2M",     "2M"),
-            ("5M",     "5M"),
-            ("10M",    "10M"),
-            ("15M",    "15M"),
-            ("20M",    "20M"),
-        ]
-        for name, val in self._bitrate_presets:
+        for name, val in self._BITRATE_PRESETS:
             self._cmb_bitrate.addItem(name, val)
         self._cmb_bitrate.setCurrentIndex(0)
         row_bitrate.addWidget(self._cmb_bitrate)
@@ -787,9 +918,7 @@ class MainWindow(QMainWindow):
 
         # Row 6: Trim
         row_trim = QHBoxLayout()
-        lbl_trim = QLabel("Trim:")
-        lbl_trim.setFixedWidth(100)
-        row_trim.addWidget(lbl_trim)
+        row_trim.addWidget(make_field_label("Trim:"))
         self._btn_trim = QPushButton("Set Trim...")
         self._btn_trim.setFixedWidth(120)
         self._btn_trim.setToolTip("Open a dialog to set start/end trim times.")
@@ -803,9 +932,7 @@ class MainWindow(QMainWindow):
 
         # Row 7: Auto-Crop
         row_crop = QHBoxLayout()
-        lbl_crop = QLabel("Auto-Crop:")
-        lbl_crop.setFixedWidth(100)
-        row_crop.addWidget(lbl_crop)
+        row_crop.addWidget(make_field_label("Auto-Crop:"))
         self._btn_crop = QPushButton("Set Crop...")
         self._btn_crop.setFixedWidth(120)
         self._btn_crop.setToolTip("Detect and remove black bars per file.")
@@ -819,9 +946,7 @@ class MainWindow(QMainWindow):
 
         # Row 8: Film Grain (SVT-AV1)
         row_grain = QHBoxLayout()
-        lbl_grain = QLabel("Film Grain:")
-        lbl_grain.setFixedWidth(100)
-        row_grain.addWidget(lbl_grain)
+        row_grain.addWidget(make_field_label("Film Grain:"))
         self._spn_film_grain = NoScrollSpinBox()
         self._spn_film_grain.setMinimum(0)
         self._spn_film_grain.setMaximum(50)
@@ -870,18 +995,38 @@ class MainWindow(QMainWindow):
 
         # --- Codec-specific parameters (dynamic) ---
         self._codec_params_group = QGroupBox("Codec Parameters")
-        self._codec_params_layout = QVBoxLayout(self._codec_params_group)
+        codec_params_layout = QVBoxLayout(self._codec_params_group)
+        self._codec_params_stack = QStackedWidget()
+        codec_params_layout.addWidget(self._codec_params_stack)
         top_layout.addWidget(self._codec_params_group)
 
         # --- Action buttons ---
         action_row = QHBoxLayout()
         self._btn_start = QPushButton("  Start Encoding  ")
+        self._btn_start.setObjectName("vccStart")
         action_row.addWidget(self._btn_start)
 
         self._btn_cancel = QPushButton("  Cancel  ")
+        self._btn_cancel.setObjectName("vccCancel")
         self._btn_cancel.setEnabled(False)
         action_row.addWidget(self._btn_cancel)
 
+        # Files encoded side by side (0 = auto, see EncoderWorker)
+        action_row.addSpacing(12)
+        action_row.addWidget(QLabel("Parallel Jobs:"))
+        self._spn_parallel_jobs = NoScrollSpinBox()
+        self._spn_parallel_jobs.setRange(0, os.cpu_count() or 8)
+        self._spn_parallel_jobs.setSpecialValueText("Auto")
+        self._spn_parallel_jobs.setValue(0)
+        self._spn_parallel_jobs.setFixedWidth(80)
+        self._spn_parallel_jobs.setToolTip(
+            "Number of files encoded at the same time.\n\n"
+            "Auto = half the CPU cores for CPU codecs,\n"
+            "two at a time for GPU encoders.\n"
+            "1 = one file after another."
+        )
+        action_row.addWidget(self._spn_parallel_jobs)
+
         action_row.addStretch()
 
         # Batch progress bar
@@ -890,6 +1035,7 @@ class MainWindow(QMainWindow):
         self._lbl_batch_progress = QLabel("Batch:")
         batch_prog_row.addWidget(self._lbl_batch_progress)
         self._progress = QProgressBar()
+        self._progress.setObjectName("vccProgress")
         self._progress.setFixedWidth(250)
         self._progress.setTextVisible(True)
         self._progress.setValue(0)
@@ -923,39 +1069,12 @@ class MainWindow(QMainWindow):
     # Styling / Theme
     # ------------------------------------------------------------------
     def _apply_theme(self):
-        """Apply the current theme (light or dark) to the entire UI."""
-        app = QApplication.instance()
-        dark = self._dark_mode
-
-        # Apply global app stylesheet + arrow images
-        theme = DARK_THEME if dark else LIGHT_THEME
-        arrows = get_arrow_stylesheet(dark)
-        app.setStyleSheet(theme + arrows)
+        """Apply the current theme (light or dark) to the entire UI.
 
-        # Menu bar
-        self.menuBar().setStyleSheet(DARK_MENUBAR_STYLE if dark else LIGHT_MENUBAR_STYLE)
-
-        # File list
-        self._file_list.setStyleSheet(DARK_FILELIST_STYLE if dark else LIGHT_FILELIST_STYLE)
-
-        # File count label
-        self._lbl_file_count.setStyleSheet(DARK_FILECOUNT_STYLE if dark else LIGHT_FILECOUNT_STYLE)
-
-        # Start / Cancel buttons
-        self._btn_start.setStyleSheet(DARK_START_BUTTON_STYLE if dark else LIGHT_START_BUTTON_STYLE)
-        self._btn_cancel.setStyleSheet(DARK_CANCEL_BUTTON_STYLE if dark else LIGHT_CANCEL_BUTTON_STYLE)
-
-        # Progress bar
-        self._progress.setStyleSheet(DARK_PROGRESS_STYLE if dark else LIGHT_PROGRESS_STYLE)
-
-        # Status bar
-        self.statusBar().setStyleSheet(DARK_STATUSBAR_STYLE if dark else LIGHT_STATUSBAR_STYLE)
-
-        # Update all '?' help buttons
-        style = DARK_HELP_BUTTON_STYLE if dark else LIGHT_HELP_BUTTON_STYLE
-        for btn in self.findChildren(QToolButton):
-            if btn.text().strip() == "?":
-                btn.setStyleSheet(style)
+        Every themed widget is matched by object name in one application
+        stylesheet, so a theme change is a single parse and polish pass.
+        """
+        QApplication.instance().setStyleSheet(build_stylesheet(self._dark_mode))
 
     def _toggle_dark_mode(self, checked: bool):
         """Toggle between dark and light themes."""
@@ -963,6 +1082,15 @@ class MainWindow(QMainWindow):
         self._settings.setValue("dark_mode", checked)
         self._apply_theme()
 
+    def _show_help(self, dialog_name: str):
+        """Open a help dialog; the help module is only imported on first use."""
+        from vcc.ui import help_dialogs
+        help_dialogs.show_help(getattr(help_dialogs, dialog_name), self)
+
+    def _prewarm_help(self):
+        from vcc.ui import help_dialogs
+        help_dialogs.prewarm_help_docs()
+
     # ------------------------------------------------------------------
     # Signal connections
     # ------------------------------------------------------------------
@@ -974,17 +1102,8 @@ class MainWindow(QMainWindow):
         self._act_clear_terminal.triggered.connect(self._terminal.clear_terminal)
         self._act_reset_defaults.triggered.connect(self._reset_defaults)
         self._act_dark_mode.triggered.connect(self._toggle_dark_mode)
-        self._act_help_codec.triggered.connect(lambda: CodecHelpDialog(self).exec())
-        self._act_help_pixfmt.triggered.connect(lambda: PixelFormatHelpDialog(self).exec())
-        self._act_help_audio.triggered.connect(lambda: AudioHelpDialog(self).exec())
-        self._act_help_resolution.triggered.connect(lambda: ResolutionHelpDialog(self).exec())
-        self._act_help_fps.triggered.connect(lambda: FPSHelpDialog(self).exec())
-        self._act_help_bitrate.triggered.connect(lambda: BitrateHelpDialog(self).exec())
-        self._act_help_gpu.triggered.connect(lambda: GPUEncodingHelpDialog(self).exec())
-        self._act_help_output_format.triggered.connect(lambda: OutputFormatHelpDialog(self).exec())
-        self._act_help_film_grain.triggered.connect(lambda: FilmGrainHelpDialog(self).exec())
-        self._act_help_sharpness.triggered.connect(lambda: SharpnessHelpDialog(self).exec())
-        self._act_about.triggered.connect(lambda: AboutDialog(self).exec())
+        for act, dialog_name in self._help_actions:
+            act.triggered.connect(lambda _=False, n=dialog_name: self._show_help(n))
 
         # Presets
         self._act_save_preset.triggered.connect(self._save_preset)
@@ -1004,6 +1123,7 @@ class MainWindow(QMainWindow):
 
         # Codec change -> rebuild params
         self._cmb_codec.currentIndexChanged.connect(self._on_codec_changed)
+        self._cmb_codec.activated.connect(self._on_codec_activated)
 
         # FPS preset -> enable/disable custom spinbox
         self._cmb_fps.currentIndexChanged.connect(self._on_fps_preset_changed)
@@ -1017,9 +1137,6 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Drag & Drop
     # ------------------------------------------------------------------
-    _DRAG_VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".mov", ".m4v", ".webm",
-                        ".ts", ".flv", ".wmv", ".mpg", ".mpeg"}
-
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             # Only accept if at least one URL is a video file or directory
@@ -1029,7 +1146,7 @@ class MainWindow(QMainWindow):
                 if os.path.isdir(p):
                     dominated = True
                     break
-                if os.path.isfile(p) and os.path.splitext(p)[1].lower() in self._DRAG_VIDEO_EXTS:
+                if os.path.isfile(p) and os.path.splitext(p)[1].lower() in self._VIDEO_EXT_SET:
                     dominated = True
                     break
             if dominated:
@@ -1043,13 +1160,10 @@ class MainWindow(QMainWindow):
             p = url.toLocalFile()
             if os.path.isfile(p):
                 ext = os.path.splitext(p)[1].lower()
-                if ext in self._DRAG_VIDEO_EXTS:
+                if ext in self._VIDEO_EXT_SET:
                     paths.append(p)
             elif os.path.isdir(p):
-                for root, _dirs, fnames in os.walk(p):
-                    for fn in sorted(fnames):
-                        if os.path.splitext(fn)[1].lower() in self._DRAG_VIDEO_EXTS:
-                            paths.append(os.path.join(root, fn))
+                paths.extend(_iter_video_files(p, self._VIDEO_EXT_SET))
         if paths:
             self._append_files(paths)
             self.statusBar().showMessage(f"Added {len(paths)} file(s) via drag & drop")
@@ -1166,10 +1280,12 @@ class MainWindow(QMainWindow):
             "output_format_idx": self._cmb_output_format.currentIndex(),
             "overwrite": self._chk_overwrite.isChecked(),
             "concat": self._chk_concat.isChecked(),
+            "copy_compliant": self._chk_copy_compliant.isChecked(),
             "trim_start": "",
             "trim_end": "",
             "film_grain": self._spn_film_grain.value(),
             "sharpness": self._spn_sharpness.value(),
+            "parallel_jobs": self._spn_parallel_jobs.value(),
         }
 
     def _apply_settings(self, settings: dict):
@@ -1181,6 +1297,7 @@ class MainWindow(QMainWindow):
             ci = settings.get("codec_idx", 0)
             if ci < self._cmb_codec.count():
                 self._cmb_codec.setCurrentIndex(ci)
+                self._codec_user_set = True
             pf_text = settings.get("pixfmt_text", "")
             if pf_text:
                 idx = self._cmb_pixfmt.findText(pf_text)
@@ -1196,8 +1313,10 @@ class MainWindow(QMainWindow):
                 self._cmb_output_format.setCurrentIndex(ofi)
             self._chk_overwrite.setChecked(settings.get("overwrite", False))
             self._chk_concat.setChecked(settings.get("concat", False))
+            self._chk_copy_compliant.setChecked(settings.get("copy_compliant", False))
             self._spn_film_grain.setValue(settings.get("film_grain", 0))
             self._spn_sharpness.setValue(settings.get("sharpness", 0))
+            self._spn_parallel_jobs.setValue(settings.get("parallel_jobs", 0))
             # Presets don't store per-file trims/crops – just clear
             self._file_trims.clear()
             self._file_crops.clear()
@@ -1262,6 +1381,10 @@ class MainWindow(QMainWindow):
         "Video Files (*.mkv *.mp4 *.avi *.mov *.m4v *.webm *.ts *.flv *.wmv *.mpg *.mpeg);;"
         "All Files (*.*)"
     )
+    _VIDEO_EXT_SET: frozenset[str] = frozenset({
+        ".mkv", ".mp4", ".avi", ".mov", ".m4v", ".webm",
+        ".ts", ".flv", ".wmv", ".mpg", ".mpeg",
+    })
 
     def _add_files(self):
         files, _ = QFileDialog.getOpenFileNames(
@@ -1273,40 +1396,41 @@ class MainWindow(QMainWindow):
     def _add_directory(self):
         dir_path = QFileDialog.getExistingDirectory(self, "Select Input Directory")
         if dir_path:
-            exts = {".mkv", ".mp4", ".avi", ".mov", ".m4v", ".webm", ".ts", ".flv", ".wmv", ".mpg", ".mpeg"}
-            found = []
-            for root, _dirs, fnames in os.walk(dir_path):
-                for fn in sorted(fnames):
-                    if os.path.splitext(fn)[1].lower() in exts:
-                        found.append(os.path.join(root, fn))
+            found = _iter_video_files(dir_path, self._VIDEO_EXT_SET)
             if found:
                 self._append_files(found)
             else:
-                QMessageBox.information(self, "No Videos", "No video files found in the selected directory.")
+                self.statusBar().showMessage("No video files found in the selected directory.", 5000)
 
     def _append_files(self, paths: list[str]):
-        existing = set()
-        for i in range(self._file_list.count()):
-            existing.add(self._file_list.item(i).data(Qt.ItemDataRole.UserRole))
-        for p in paths:
-            if p not in existing:
-                item = QListWidgetItem(p)
-                item.setData(Qt.ItemDataRole.UserRole, p)
-                self._file_list.addItem(item)
+        with _list_batch(self._file_list) as lw:
+            for p in paths:
+                if p not in self._file_paths:
+                    self._file_paths[p] = None
+                    item = QListWidgetItem(os.path.basename(p))
+                    item.setData(Qt.ItemDataRole.UserRole, p)
+                    item.setToolTip(p)
+                    lw.addItem(item)
         self._update_file_count()
 
     def _remove_selected_files(self):
-        for item in self._file_list.selectedItems():
-            filepath = item.data(Qt.ItemDataRole.UserRole)
-            self._file_trims.pop(filepath, None)
-            self._file_crops.pop(filepath, None)
-            self._file_list.takeItem(self._file_list.row(item))
+        lw = self._file_list
+        # Take rows from the bottom up so the remaining indices stay valid
+        rows = sorted({lw.row(item) for item in lw.selectedItems()}, reverse=True)
+        with _list_batch(lw):
+            for row in rows:
+                filepath = lw.takeItem(row).data(Qt.ItemDataRole.UserRole)
+                self._file_trims.pop(filepath, None)
+                self._file_crops.pop(filepath, None)
+                self._file_paths.pop(filepath, None)
         self._update_file_count()
         self._update_trim_label()
         self._update_crop_label()
 
     def _clear_files(self):
-        self._file_list.clear()
+        with _list_batch(self._file_list) as lw:
+            lw.clear()
+        self._file_paths.clear()
         self._file_trims.clear()
         self._file_crops.clear()
         self._update_file_count()
@@ -1314,7 +1438,7 @@ class MainWindow(QMainWindow):
         self._update_crop_label()
 
     def _update_file_count(self):
-        count = self._file_list.count()
+        count = len(self._file_paths)
         self._lbl_file_count.setText(f"{count} file{'s' if count != 1 else ''}")
 
     def _browse_output(self):
@@ -1325,19 +1449,39 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
     # Codec parameter panel (dynamic)
     # ------------------------------------------------------------------
+    def _on_codec_activated(self, _index: int):
+        """The user picked a codec; keep it when the GPU probe returns."""
+        self._codec_user_set = True
+
     def _on_codec_changed(self):
-        # Remove old param widgets
-        for w in self._codec_param_widgets:
-            self._codec_params_layout.removeWidget(w)
-            w.deleteLater()
-        self._codec_param_widgets.clear()
+        codec_key = self._cmb_codec.currentData() or ""
+
+        # Each codec's parameter page is built once and kept in the stack
+        page = self._codec_param_pages.get(codec_key)
+        if page is None:
+            page = self._build_codec_param_page(codec_key)
+            self._codec_param_pages[codec_key] = page
+            self._codec_params_stack.addWidget(page[0])
+        self._codec_params_stack.setCurrentWidget(page[0])
+        self._codec_param_widgets = page[1]
 
-        codec_key = self._cmb_codec.currentData()
         if not codec_key:
-            self._codec_params_layout.addStretch()
             return
 
-        gpu_enc = get_gpu_encoder(codec_key)
+        # Filter pixel format dropdown for the selected encoder
+        self._update_pixfmt_combo(codec_key)
+
+        # Filter output format dropdown for the selected codec
+        self._update_output_format_combo(codec_key)
+
+    def _build_codec_param_page(self, codec_key: str) -> tuple[QWidget, list[QWidget]]:
+        """Create the parameter page for *codec_key* and return it with its rows."""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        widgets: list[QWidget] = []
+
+        gpu_enc = get_gpu_encoder(codec_key) if codec_key else None
         if gpu_enc:
             # ── GPU encoder: build preset + quality widgets ──
             # Preset widget
@@ -1353,9 +1497,7 @@ class MainWindow(QMainWindow):
                 preset_def["default"] = gpu_enc.preset_default
                 preset_def["min"] = 0
                 preset_def["max"] = 100
-            pw = CodecParamWidget(gpu_enc.preset_key, preset_def)
-            self._codec_params_layout.addWidget(pw)
-            self._codec_param_widgets.append(pw)
+            widgets.append(CodecParamWidget(gpu_enc.preset_key, preset_def))
 
             # Quality widget
             quality_def = {
@@ -1366,33 +1508,32 @@ class MainWindow(QMainWindow):
                 "max": gpu_enc.quality_max,
                 "tooltip": gpu_enc.quality_tooltip,
             }
-            qw = CodecParamWidget(gpu_enc.quality_param, quality_def)
-            self._codec_params_layout.addWidget(qw)
-            self._codec_param_widgets.append(qw)
+            widgets.append(CodecParamWidget(gpu_enc.quality_param, quality_def))
 
             # GPU indicator label
             vendor_icons = {"NVIDIA": "\U0001F7E2", "AMD": "\U0001F534", "Intel": "\U0001F535"}
             icon = vendor_icons.get(gpu_enc.vendor, "\U0001F3AE")
             lbl = QLabel(f"{icon} GPU Encoding ({gpu_enc.vendor}) — Near-zero CPU usage, 10–50× faster")
             lbl.setStyleSheet("font-style: italic; padding: 4px 0;")
-            self._codec_params_layout.addWidget(lbl)
-            self._codec_param_widgets.append(lbl)
+            widgets.append(lbl)
         elif codec_key in CODECS:
             # ── CPU encoder: use CODECS dict ──
             params = CODECS[codec_key].get("params", {})
             for pkey, pdef in params.items():
-                widget = CodecParamWidget(pkey, pdef)
-                self._codec_params_layout.addWidget(widget)
-                self._codec_param_widgets.append(widget)
+                widgets.append(CodecParamWidget(pkey, pdef))
 
-        # Filter pixel format dropdown for the selected encoder
-        self._update_pixfmt_combo(codec_key)
-
-        # Filter output format dropdown for the selected codec
-        self._update_output_format_combo(codec_key)
+        for w in widgets:
+            layout.addWidget(w)
+        layout.addStretch()
+        return page, widgets
 
-        # Add stretch at end
-        self._codec_params_layout.addStretch()
+    def _discard_codec_param_pages(self):
+        """Drop every cached parameter page so they are rebuilt with defaults."""
+        for page, _widgets in self._codec_param_pages.values():
+            self._codec_params_stack.removeWidget(page)
+            page.deleteLater()
+        self._codec_param_pages.clear()
+        self._codec_param_widgets = []
 
     # Codec family → compatible output containers
     _CODEC_FORMAT_MAP: dict[str, set[str]] = {
@@ -1432,7 +1573,7 @@ class MainWindow(QMainWindow):
         self._cmb_output_format.clear()
         # Auto is always available
         self._cmb_output_format.addItem("Auto", "")
-        for name, val in self._output_formats:
+        for name, val in self._OUTPUT_FORMATS:
             if not val:
                 continue  # skip Auto, already added
             if allowed is None or val in allowed:
@@ -1473,10 +1614,9 @@ class MainWindow(QMainWindow):
         self._cmb_pixfmt.blockSignals(True)
         self._cmb_pixfmt.clear()
 
-        for pf in PIXEL_FORMATS:
+        for label, pf in _PIXFMT_ITEMS:
             if accept(pf):
-                ffname, display = pf[0], pf[1]
-                self._cmb_pixfmt.addItem(f"{ffname}  —  {display}", ffname)
+                self._cmb_pixfmt.addItem(label, pf[0])
 
         # Try to restore previous selection
         idx = self._cmb_pixfmt.findData(previous)
@@ -1502,33 +1642,29 @@ class MainWindow(QMainWindow):
         """Return the FPS value to use: preset value or custom spinbox."""
         data = self._cmb_fps.currentData()
         if data == "__custom__":
-            val = self._spn_custom_fps.value()
-            # Format nicely: strip trailing zeros
-            if val == int(val):
-                return str(int(val))
-            return f"{val:.3f}".rstrip('0').rstrip('.')
+            # At most 3 decimals and 300 fps, so %g is exact and has no
+            # trailing zeros: 30.0 -> "30", 23.976 -> "23.976"
+            return f"{self._spn_custom_fps.value():g}"
         return data or ""
 
     def _on_resolution_preset_changed(self, index: int):
         """When a resolution preset is selected, auto-fill Width/Height."""
-        if index < 0 or index >= len(self._resolution_presets):
+        if index < 0 or index >= len(self._RESOLUTION_PRESETS):
             return
-        _, w, h = self._resolution_presets[index]
+        _, w, h = self._RESOLUTION_PRESETS[index]
         if w is None or h is None:
             return  # "Custom" – do nothing
         # Block signals on spinboxes so they don't trigger _on_resolution_manual_change
-        self._spn_width.blockSignals(True)
-        self._spn_height.blockSignals(True)
-        self._spn_width.setValue(w)
-        self._spn_height.setValue(h)
-        self._spn_width.blockSignals(False)
-        self._spn_height.blockSignals(False)
+        with QSignalBlocker(self._spn_width), QSignalBlocker(self._spn_height):
+            self._spn_width.setValue(w)
+            self._spn_height.setValue(h)
 
     def _on_resolution_manual_change(self):
-        """When Width or Height is changed manually, switch preset to Custom."""
-        self._cmb_resolution_preset.blockSignals(True)
-        self._cmb_resolution_preset.setCurrentIndex(0)  # "Custom"
-        self._cmb_resolution_preset.blockSignals(False)
+        """When Width or Height is changed manually, select the matching
+        preset, or Custom if the size is not one of the presets."""
+        idx = self._RESOLUTION_INDEX.get((self._spn_width.value(), self._spn_height.value()), 0)
+        with QSignalBlocker(self._cmb_resolution_preset):
+            self._cmb_resolution_preset.setCurrentIndex(idx)
 
     # ------------------------------------------------------------------
     # Defaults
@@ -1537,7 +1673,7 @@ class MainWindow(QMainWindow):
         self._cmb_resolution_preset.setCurrentIndex(6)  # 720p HD
         self._spn_width.setValue(1280)
         self._spn_height.setValue(720)
-        idx = self._cmb_codec.findData("libsvtav1")
+        idx = self._cmb_codec.findData(self._default_codec())
         if idx >= 0:
             self._cmb_codec.setCurrentIndex(idx)
         pf_idx = self._cmb_pixfmt.findData("yuv420p10le")
@@ -1552,12 +1688,15 @@ class MainWindow(QMainWindow):
         self._cmb_output_format.setCurrentIndex(0)
         self._chk_overwrite.setChecked(False)
         self._chk_concat.setChecked(False)
+        self._chk_copy_compliant.setChecked(False)
         self._file_trims.clear()
         self._file_crops.clear()
         self._update_trim_label()
         self._update_crop_label()
         self._spn_film_grain.setValue(0)
         self._spn_sharpness.setValue(0)
+        self._spn_parallel_jobs.setValue(0)
+        self._discard_codec_param_pages()
         self._on_codec_changed()
         self.statusBar().showMessage("Settings reset to defaults")
 
@@ -1573,7 +1712,7 @@ class MainWindow(QMainWindow):
 
     def _start_encoding(self):
         # Validate
-        if self._file_list.count() == 0:
+        if not self._file_paths:
             QMessageBox.warning(self, "No Files", "Please add video files to encode.")
             return
 
@@ -1582,10 +1721,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Output", "Please select an output directory.")
             return
 
-        # Gather files
-        files = []
-        for i in range(self._file_list.count()):
-            files.append(self._file_list.item(i).data(Qt.ItemDataRole.UserRole))
+        files = list(self._file_paths)
 
         # Gather codec params
         codec_params = {}
@@ -1620,14 +1756,25 @@ class MainWindow(QMainWindow):
             concatenate=self._chk_concat.isChecked(),
             film_grain=self._spn_film_grain.value(),
             sharpness=self._spn_sharpness.value(),
+            parallel_jobs=self._spn_parallel_jobs.value(),
+            copy_compliant=self._chk_copy_compliant.isChecked(),
+            parent=self,
         )
+        worker = self._worker
+        # Tracked until the thread ends, so closing the window can wait for it
+        self._live_workers.add(worker)
+        worker.finished.connect(lambda: self._on_worker_thread_finished(worker))
+        # The thread deletes itself once run() has returned (see _cleanup_worker)
+        worker.finished.connect(worker.deleteLater)
 
         self._worker.log_output.connect(self._terminal.append_text)
         self._worker.file_started.connect(self._on_file_started)
         self._worker.file_finished.connect(self._on_file_finished)
-        self._worker.encoding_done.connect(self._on_encoding_done)
-        self._worker.encoding_error.connect(self._on_encoding_error)
+        self._worker.file_progress.connect(self._on_file_progress)
+        self._worker.encoding_terminated.connect(self._on_encoding_terminated)
 
+        self._completed = 0
+        self._status_files.clear()
         self._progress.setMaximum(len(files))
         self._progress.setValue(0)
         self._btn_start.setEnabled(False)
@@ -1643,37 +1790,76 @@ class MainWindow(QMainWindow):
         if self._worker:
             self._worker.cancel()
         self._btn_cancel.setEnabled(False)
+        self._progress_timer.stop()
         self.statusBar().showMessage("Cancelling...")
 
     def _on_file_started(self, idx, total, name):
-        self.statusBar().showMessage(f"[{idx}/{total}] Encoding: {name}")
+        self._progress_timer.stop()
+        self._status_files[idx] = f"[{idx}/{total}] Encoding: {name}"
+        self.statusBar().showMessage(self._status_files[idx])
+
+    def _on_file_progress(self, idx, percent, speed, eta):
+        self._pending_progress = (idx, percent, speed, eta)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_file_progress(self):
+        idx, percent, speed, eta = self._pending_progress
+        msg = f"{self._status_files.get(idx, '')}  —  {percent}%"
+        if speed:
+            msg += f"  ·  {speed}"
+        if eta:
+            msg += f"  ·  ETA {eta}"
+        self.statusBar().showMessage(msg)
 
     def _on_file_finished(self, idx, total, name, success):
-        self._progress.setValue(idx)
-
-    def _on_encoding_done(self):
+        # Files may finish out of order when encoded in parallel
+        self._status_files.pop(idx, None)
+        self._completed += 1
+        if not self._finished_timer.isActive():
+            self._finished_timer.start()
+
+    def _flush_batch_progress(self):
+        self._progress.setValue(self._completed)
+
+    def _on_encoding_terminated(self, error):
+        self._progress_timer.stop()
+        self._finished_timer.stop()
+        self._flush_batch_progress()
+        if error:
+            QMessageBox.critical(self, "FFmpeg Error", error)
         self._btn_start.setEnabled(True)
         self._btn_cancel.setEnabled(False)
         self._cleanup_worker()
-        self.statusBar().showMessage("Encoding complete")
-
-    def _on_encoding_error(self, msg):
-        QMessageBox.critical(self, "FFmpeg Error", msg)
-        self._btn_start.setEnabled(True)
-        self._btn_cancel.setEnabled(False)
-        self._cleanup_worker()
-        self.statusBar().showMessage("Error occurred")
+        self.statusBar().showMessage("Error occurred" if error else "Encoding complete")
 
     def _cleanup_worker(self):
-        """Safely clean up the encoder worker thread."""
-        if self._worker is not None:
-            self._worker.wait(5000)  # wait for thread to fully finish
-            self._worker.deleteLater()  # schedule safe Qt deletion
-            self._worker = None
+        """Release the encoder worker without blocking the GUI thread.
+
+        encoding_terminated is emitted at the very end of run(), so the
+        thread finishes right after; its finished signal then deletes it.
+        The window is its parent, which keeps it alive until then.
+        """
+        self._worker = None
+
+    def _on_worker_thread_finished(self, worker: EncoderWorker):
+        """Forget *worker* once its thread ends; finish a deferred close."""
+        worker.wait()  # run() has returned, so this only waits for the exit
+        self._live_workers.discard(worker)
+        if self._close_pending and not self._live_workers:
+            self.close()
 
     # ------------------------------------------------------------------
-    # Close event
+    # Show / close events
     # ------------------------------------------------------------------
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._params_initialized:
+            self._params_initialized = True
+            self._on_codec_changed()
+            # Parse the help pages once the window is up and idle
+            QTimer.singleShot(2000, self._prewarm_help)
+
     def closeEvent(self, event):
         if self._worker and self._worker.isRunning():
             reply = QMessageBox.question(
@@ -1683,11 +1869,15 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No,
             )
-            if reply == QMessageBox.StandardButton.Yes:
-                self._worker.cancel()
-                self._worker.wait(5000)
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            event.accept()
+                return
+            self._worker.cancel()
+        if self._live_workers:
+            # The window owns the worker, and destroying a running QThread
+            # aborts the process: close again once the thread has ended
+            self._close_pending = True
+            self.statusBar().showMessage("Stopping encoder...")
+            event.ignore()
+            return
+        event.accept()
@@ -4,7 +4,10 @@ Embedded terminal widget - a dark themed text area mimicking a console.
 
 from PyQt6.QtWidgets import QPlainTextEdit
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QPalette
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+
+# Text appended within this window is inserted into the document at once
+_FLUSH_INTERVAL_MS = 50
 
 
 class TerminalWidget(QPlainTextEdit):
@@ -39,12 +42,30 @@ class TerminalWidget(QPlainTextEdit):
 
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
 
+        # Appended text is buffered so that several log_output signals
+        # (e.g. from parallel encodes) cost one insert + relayout
+        self._pending: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def append_text(self, text: str):
-        """Append text and scroll to bottom."""
+        """Append text and scroll to bottom (batched, see ``_flush``)."""
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
         self.moveCursor(QTextCursor.MoveOperation.End)
         self.insertPlainText(text)
-        self.moveCursor(QTextCursor.MoveOperation.End)
         self.ensureCursorVisible()
 
     def clear_terminal(self):
+        self._pending.clear()
+        self._flush_timer.stop()
         self.clear()
@@ -6,6 +6,7 @@ import os
 import tempfile
 
 _arrow_cache: dict[str, str] = {}
+_stylesheet_cache: dict[bool, str] = {}
 
 
 def _ensure_arrow_images() -> dict[str, str]:
@@ -86,6 +87,16 @@ def get_arrow_stylesheet(dark: bool) -> str:
     }}
     """
 
+# Help dialog browsers keep the same light page in both themes
+_HELP_BROWSER_STYLE = """
+    QTextBrowser#HelpBrowser {
+        background-color: #fafafa;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 8px;
+    }
+"""
+
 LIGHT_THEME = """
     QWidget {
         font-family: 'Segoe UI', sans-serif;
@@ -173,7 +184,7 @@ LIGHT_THEME = """
     QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
         background: #e0e0e0;
     }
-"""
+""" + _HELP_BROWSER_STYLE
 
 DARK_THEME = """
     QWidget {
@@ -397,7 +408,7 @@ DARK_THEME = """
         background-color: #2b2b2b;
         color: #e0e0e0;
     }
-"""
+""" + _HELP_BROWSER_STYLE
 
 LIGHT_MENUBAR_STYLE = """
     QMenuBar {
@@ -497,7 +508,7 @@ DARK_GROUP_STYLE = """
 """
 
 LIGHT_HELP_BUTTON_STYLE = """
-    QToolButton {
+    QToolButton#vccHelp {
         background: #e0e0e0;
         border: 1px solid #aaa;
         border-radius: 11px;
@@ -505,22 +516,15 @@ LIGHT_HELP_BUTTON_STYLE = """
         font-size: 11px;
         color: #444;
     }
-    QToolButton:hover {
+    QToolButton#vccHelp:hover {
         background: #cde4ff;
         border-color: #4a90d9;
         color: #1a1a1a;
     }
-    QToolTip {
-        background-color: #2b2b2b;
-        color: #e0e0e0;
-        border: 1px solid #555;
-        padding: 8px;
-        font-size: 12px;
-    }
 """
 
 DARK_HELP_BUTTON_STYLE = """
-    QToolButton {
+    QToolButton#vccHelp {
         background: #4a4a4a;
         border: 1px solid #666;
         border-radius: 11px;
@@ -528,11 +532,26 @@ DARK_HELP_BUTTON_STYLE = """
         font-size: 11px;
         color: #ccc;
     }
-    QToolButton:hover {
+    QToolButton#vccHelp:hover {
         background: #3a5a8a;
         border-color: #5a9fd4;
         color: #fff;
     }
+"""
+
+# Tooltips are top-level windows, so an application sheet cannot scope
+# QToolTip to the '?' buttons: this styles every tooltip in the app
+LIGHT_TOOLTIP_STYLE = """
+    QToolTip {
+        background-color: #2b2b2b;
+        color: #e0e0e0;
+        border: 1px solid #555;
+        padding: 8px;
+        font-size: 12px;
+    }
+"""
+
+DARK_TOOLTIP_STYLE = """
     QToolTip {
         background-color: #3c3c3c;
         color: #e0e0e0;
@@ -543,7 +562,7 @@ DARK_HELP_BUTTON_STYLE = """
 """
 
 LIGHT_START_BUTTON_STYLE = """
-    QPushButton {
+    QPushButton#vccStart {
         background-color: #2e7d32;
         color: white;
         font-size: 14px;
@@ -552,19 +571,19 @@ LIGHT_START_BUTTON_STYLE = """
         border: none;
         border-radius: 6px;
     }
-    QPushButton:hover {
+    QPushButton#vccStart:hover {
         background-color: #388e3c;
     }
-    QPushButton:pressed {
+    QPushButton#vccStart:pressed {
         background-color: #1b5e20;
     }
-    QPushButton:disabled {
+    QPushButton#vccStart:disabled {
         background-color: #999;
     }
 """
 
 DARK_START_BUTTON_STYLE = """
-    QPushButton {
+    QPushButton#vccStart {
         background-color: #2e7d32;
         color: white;
         font-size: 14px;
@@ -573,20 +592,20 @@ DARK_START_BUTTON_STYLE = """
         border: none;
         border-radius: 6px;
     }
-    QPushButton:hover {
+    QPushButton#vccStart:hover {
         background-color: #388e3c;
     }
-    QPushButton:pressed {
+    QPushButton#vccStart:pressed {
         background-color: #1b5e20;
     }
-    QPushButton:disabled {
+    QPushButton#vccStart:disabled {
         background-color: #555;
         color: #888;
     }
 """
 
 LIGHT_CANCEL_BUTTON_STYLE = """
-    QPushButton {
+    QPushButton#vccCancel {
         background-color: #c62828;
         color: white;
         font-size: 14px;
@@ -595,19 +614,19 @@ LIGHT_CANCEL_BUTTON_STYLE = """
         border: none;
         border-radius: 6px;
     }
-    QPushButton:hover {
+    QPushButton#vccCancel:hover {
         background-color: #e53935;
     }
-    QPushButton:pressed {
+    QPushButton#vccCancel:pressed {
         background-color: #b71c1c;
     }
-    QPushButton:disabled {
+    QPushButton#vccCancel:disabled {
         background-color: #999;
     }
 """
 
 DARK_CANCEL_BUTTON_STYLE = """
-    QPushButton {
+    QPushButton#vccCancel {
         background-color: #c62828;
         color: white;
         font-size: 14px;
@@ -616,34 +635,34 @@ DARK_CANCEL_BUTTON_STYLE = """
         border: none;
         border-radius: 6px;
     }
-    QPushButton:hover {
+    QPushButton#vccCancel:hover {
         background-color: #e53935;
     }
-    QPushButton:pressed {
+    QPushButton#vccCancel:pressed {
         background-color: #b71c1c;
     }
-    QPushButton:disabled {
+    QPushButton#vccCancel:disabled {
         background-color: #555;
         color: #888;
     }
 """
 
 LIGHT_PROGRESS_STYLE = """
-    QProgressBar {
+    QProgressBar#vccProgress {
         border: 1px solid #c0c0c0;
         border-radius: 4px;
         text-align: center;
         height: 22px;
         background: #f0f0f0;
     }
-    QProgressBar::chunk {
+    QProgressBar#vccProgress::chunk {
         background-color: #4caf50;
         border-radius: 3px;
     }
 """
 
 DARK_PROGRESS_STYLE = """
-    QProgressBar {
+    QProgressBar#vccProgress {
         border: 1px solid #555;
         border-radius: 4px;
         text-align: center;
@@ -651,39 +670,39 @@ DARK_PROGRESS_STYLE = """
         background: #3c3c3c;
         color: #e0e0e0;
     }
-    QProgressBar::chunk {
+    QProgressBar#vccProgress::chunk {
         background-color: #4caf50;
         border-radius: 3px;
     }
 """
 
 LIGHT_FILELIST_STYLE = """
-    QListWidget {
+    QListWidget#vccFileList {
         border: 1px solid #c0c0c0;
         border-radius: 4px;
         background: #fff;
         font-size: 11px;
     }
-    QListWidget::item {
+    QListWidget#vccFileList::item {
         padding: 2px 4px;
     }
-    QListWidget::item:selected {
+    QListWidget#vccFileList::item:selected {
         background: #cde4ff;
     }
 """
 
 DARK_FILELIST_STYLE = """
-    QListWidget {
+    QListWidget#vccFileList {
         border: 1px solid #555;
         border-radius: 4px;
         background: #333;
         color: #e0e0e0;
         font-size: 11px;
     }
-    QListWidget::item {
+    QListWidget#vccFileList::item {
         padding: 2px 4px;
     }
-    QListWidget::item:selected {
+    QListWidget#vccFileList::item:selected {
         background: #3a5a8a;
         color: #fff;
     }
@@ -692,5 +711,44 @@ DARK_FILELIST_STYLE = """
 LIGHT_STATUSBAR_STYLE = "QStatusBar { border-top: 1px solid #d0d0d0; color: #555; }"
 DARK_STATUSBAR_STYLE = "QStatusBar { border-top: 1px solid #555; color: #aaa; background: #2b2b2b; }"
 
-LIGHT_FILECOUNT_STYLE = "color: #666; font-style: italic;"
-DARK_FILECOUNT_STYLE = "color: #aaa; font-style: italic;"
+LIGHT_FILECOUNT_STYLE = "QLabel#vccFileCount { color: #666; font-style: italic; }"
+DARK_FILECOUNT_STYLE = "QLabel#vccFileCount { color: #aaa; font-style: italic; }"
+
+# Theme-independent sizes, applied in one polish pass instead of
+# per-widget setFixedWidth() calls
+_LAYOUT_STYLE = """
+    QLabel#vccFieldLabel { min-width: 100px; max-width: 100px; }
+    QPushButton#vccFileBtn { min-width: 90px; }
+"""
+
+
+def build_stylesheet(dark: bool) -> str:
+    """Return the complete application stylesheet for the given theme.
+
+    Widget-specific rules are selected by object name (``#vccStart``,
+    ``#vccFileList``, ...) so the whole UI is styled by one sheet set on
+    the QApplication.  The composed sheet is cached per theme.
+    """
+    sheet = _stylesheet_cache.get(dark)
+    if sheet is not None:
+        return sheet
+    if dark:
+        parts = (
+            DARK_THEME, get_arrow_stylesheet(True), DARK_MENUBAR_STYLE,
+            DARK_FILELIST_STYLE, DARK_FILECOUNT_STYLE,
+            DARK_START_BUTTON_STYLE, DARK_CANCEL_BUTTON_STYLE,
+            DARK_PROGRESS_STYLE, DARK_STATUSBAR_STYLE, DARK_HELP_BUTTON_STYLE,
+            DARK_TOOLTIP_STYLE,
+            _LAYOUT_STYLE,
+        )
+    else:
+        parts = (
+            LIGHT_THEME, get_arrow_stylesheet(False), LIGHT_MENUBAR_STYLE,
+            LIGHT_FILELIST_STYLE, LIGHT_FILECOUNT_STYLE,
+            LIGHT_START_BUTTON_STYLE, LIGHT_CANCEL_BUTTON_STYLE,
+            LIGHT_PROGRESS_STYLE, LIGHT_STATUSBAR_STYLE, LIGHT_HELP_BUTTON_STYLE,
+            LIGHT_TOOLTIP_STYLE,
+            _LAYOUT_STYLE,
+        )
+    sheet = _stylesheet_cache[dark] = "\n".join(parts)
+    return sheet